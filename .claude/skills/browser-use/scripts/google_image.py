@@ -25,19 +25,21 @@ import logging
 import re
 import time
 import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import ClassVar, Literal
+from typing import ClassVar, Iterable, Iterator, Literal
 
 import requests
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import sync_playwright, Page, TimeoutError as PlaywrightTimeout
 
 logger = logging.getLogger(__name__)
 
 # Constants for download optimization
 DEFAULT_DOWNLOAD_WORKERS = 10
 DEFAULT_DOWNLOAD_TIMEOUT = 15
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
 
 # Size mapping for DuckDuckGo
 DDGS_SIZE_MAP = {
@@ -58,6 +60,9 @@ MIN_DIMENSION = {
 }
 
 
+# Results requested from DuckDuckGo per image wanted (headroom for dimension filtering)
+DDGS_OVERFETCH_FACTOR = 3
+
 # Time range mapping for DuckDuckGo
 DDGS_TIME_MAP = {
     "Day": "d",
@@ -101,71 +106,46 @@ def search_duckduckgo_images(
         ddgs_time = DDGS_TIME_MAP.get(time_range) if time_range else None
         min_dim = MIN_DIMENSION.get(size, 0) if size else 0
 
-        # Pagination: keep fetching until we have enough images meeting size criteria
         images = []
-        seen_urls = set()
         filtered_count = 0
-        batch_size = 100  # Fetch 100 at a time
-        max_batches = 10  # Max 1000 images total to prevent infinite loops
 
-        with DDGS() as ddgs:
-            for batch_num in range(max_batches):
-                if len(images) >= num:
-                    break
-
-                # Calculate offset for pagination
-                offset = batch_num * batch_size
-
-                # Build kwargs for images() call
-                images_kwargs = {
-                    "keywords": keyword,
-                    "region": "wt-wt",
-                    "safesearch": "off",
-                    "max_results": batch_size + offset,
-                }
-                if ddgs_size:
-                    images_kwargs["size"] = ddgs_size
-                if ddgs_time:
-                    images_kwargs["timelimit"] = ddgs_time
+        # One request sized for the dimension filter; DDGS pages and dedupes internally.
+        # Re-requesting with a growing max_results re-fetched every earlier page.
+        images_kwargs = {
+            "keywords": keyword,
+            "region": "wt-wt",
+            "safesearch": "off",
+            "max_results": num * DDGS_OVERFETCH_FACTOR,
+        }
+        if ddgs_size:
+            images_kwargs["size"] = ddgs_size
+        if ddgs_time:
+            images_kwargs["timelimit"] = ddgs_time
 
-                results = list(ddgs.images(**images_kwargs))
+        images_append = images.append  # bound once for the filter loop
 
-                # Skip already seen results (pagination returns cumulative results)
-                new_results = results[offset:] if offset < len(results) else []
+        with DDGS() as ddgs:
+            # Filter by actual dimensions
+            for r in ddgs.images(**images_kwargs):
+                width = r.get("width", 0)
+                height = r.get("height", 0)
+
+                # Filter by minimum dimension if size filter is specified
+                if min_dim > 0 and width < min_dim and height < min_dim:
+                    filtered_count += 1
+                    continue
+
+                images_append({
+                    "url": r.get("image", ""),
+                    "title": r.get("title", ""),
+                    "source": r.get("url", ""),
+                    "width": width,
+                    "height": height,
+                })
 
-                if not new_results:
-                    logger.info("DuckDuckGo: no more images available after %d results", offset)
+                if len(images) >= num:
                     break
 
-                # Filter by actual dimensions
-                for r in new_results:
-                    url = r.get("image", "")
-                    if url in seen_urls:
-                        continue
-                    seen_urls.add(url)
-
-                    width = r.get("width", 0)
-                    height = r.get("height", 0)
-
-                    # Filter by minimum dimension if size filter is specified
-                    if min_dim > 0 and max(width, height) < min_dim:
-                        filtered_count += 1
-                        continue
-
-                    images.append({
-                        "url": url,
-                        "title": r.get("title", ""),
-                        "source": r.get("url", ""),
-                        "width": width,
-                        "height": height,
-                    })
-
-                    if len(images) >= num:
-                        break
-
-                logger.info("DuckDuckGo batch %d: found %d/%d images (filtered %d)",
-                           batch_num + 1, len(images), num, filtered_count)
-
         if filtered_count > 0:
             logger.info("DuckDuckGo: total filtered out %d images smaller than %dpx", filtered_count, min_dim)
         logger.info("DuckDuckGo found %d images meeting size criteria", len(images))
@@ -188,29 +168,69 @@ SIZE_PARAMS = {
     "Icon": "isz:i",
 }
 
+# URL parameters for time range filters
+TIME_PARAMS = {
+    "Day": "qdr:d",
+    "Week": "qdr:w",
+    "Month": "qdr:m",
+    "Year": "qdr:y",
+}
 
-def extract_image_urls_from_source(html: str, limit: int = 100) -> list[str]:
-    """Extract full-size image URLs from Google Images page source using regex.
 
-    This is 19x faster than clicking thumbnails because URLs are embedded
-    in AF_initDataCallback JavaScript functions.
+def _build_tbs(size: str, time_range: str | None) -> str:
+    """Build the static part of Google's tbs parameter (size + time range)."""
+    parts = [SIZE_PARAMS.get(size, "isz:l")]
+    if time_range in TIME_PARAMS:
+        parts.append(TIME_PARAMS[time_range])
+    return ",".join(parts)
 
-    Args:
-        html: Page source HTML
-        limit: Maximum number of URLs to extract
 
-    Returns:
-        List of full-size image URLs
-    """
-    urls = []
-    seen = set()
+# Every legal (size, time_range) combination, built once at import
+_TBS_CACHE = {
+    (size, time_range): _build_tbs(size, time_range)
+    for size in SIZE_PARAMS
+    for time_range in (None, *TIME_PARAMS)
+}
+
+# Pattern matches: ["https://example.com/image.jpg", width, height]
+_IMG_URL_RE = re.compile(r'\["(https?://[^"]+)",\s*\d+,\s*\d+\]')
+
+# Upper bound on regex matches scanned per URL requested - pages with thousands
+# of thumbnails would otherwise be scanned end to end when filters reject matches
+_MAX_MATCHES_PER_URL = 6
+
+
+# In-page equivalent of _IMG_URL_RE: scans the DOM inside the browser and returns
+# only the matched URLs, instead of shipping the whole serialized page to Python
+_EXTRACT_IMG_URLS_JS = r"""
+([maxMatches]) => {
+    const re = /\["(https?:\/\/[^"]+)",\s*\d+,\s*\d+\]/g;
+    const html = document.documentElement.outerHTML;
+    const urls = new Set();
+    let scanned = 0;
+    let m;
+    while (scanned < maxMatches && (m = re.exec(html)) !== null) {
+        scanned++;
+        if (!m[1].includes('encrypted-tbn0.gstatic.com')) urls.add(m[1]);
+    }
+    return [...urls];
+}
+"""
 
-    # Pattern matches: ["https://example.com/image.jpg", width, height]
-    pattern = r'\["(https?://[^"]+)",\s*\d+,\s*\d+\]'
 
-    for match in re.finditer(pattern, html):
-        url = match.group(1)
+def _iter_filtered_urls(raw_urls: Iterable[str]) -> Iterator[str]:
+    """Yield full-size image URLs from raw Google Images regex matches.
 
+    URLs are unescaped and thumbnails skipped, but nothing is deduplicated -
+    callers keep their own seen set so one set can span several extractions.
+
+    Args:
+        raw_urls: URLs as matched in the page source (may contain \\u escapes)
+
+    Yields:
+        Full-size image URLs
+    """
+    for url in raw_urls:
         # Skip Google's thumbnail CDN
         if "encrypted-tbn0.gstatic.com" in url:
             continue
@@ -229,6 +249,41 @@ def extract_image_urls_from_source(html: str, limit: int = 100) -> list[str]:
         except (UnicodeDecodeError, ValueError):
             pass
 
+        yield url
+
+
+def iter_image_urls_from_source(html: str, max_matches: int | None = None) -> Iterator[str]:
+    """Lazily extract full-size image URLs from Google Images page source.
+
+    This is 19x faster than clicking thumbnails because URLs are embedded
+    in AF_initDataCallback JavaScript functions.
+
+    Args:
+        html: Page source HTML
+        max_matches: Maximum number of regex matches to scan (None = all)
+
+    Returns:
+        Iterator of full-size image URLs (may repeat)
+    """
+    matches = islice(_IMG_URL_RE.finditer(html), max_matches)
+    return _iter_filtered_urls(m.group(1) for m in matches)
+
+
+def extract_image_urls_from_source(html: str, limit: int = 100) -> list[str]:
+    """Extract up to limit unique full-size image URLs from page source.
+
+    Args:
+        html: Page source HTML
+        limit: Maximum number of URLs to extract (also caps the scan at
+            limit * _MAX_MATCHES_PER_URL regex matches)
+
+    Returns:
+        List of full-size image URLs
+    """
+    urls = []
+    seen = set()
+
+    for url in iter_image_urls_from_source(html, limit * _MAX_MATCHES_PER_URL):
         if url not in seen:
             seen.add(url)
             urls.append(url)
@@ -238,16 +293,43 @@ def extract_image_urls_from_source(html: str, limit: int = 100) -> list[str]:
     return urls
 
 
+def iter_image_urls_from_page(page: Page, max_matches: int) -> Iterator[str]:
+    """Extract full-size image URLs by running the regex inside the browser.
+
+    Avoids page.content(), which serializes the whole DOM and sends it over
+    the CDP connection on every call. Only the matched URLs cross the wire.
+    Falls back to iter_image_urls_from_source() if evaluation fails.
+
+    The page is queried when this function is called; filtering of the
+    returned URLs happens lazily as the iterator is consumed.
+
+    Args:
+        page: Playwright page with Google Images results loaded
+        max_matches: Maximum number of regex matches to scan
+
+    Returns:
+        Iterator of full-size image URLs (may repeat across calls)
+    """
+    try:
+        raw_urls = page.evaluate(_EXTRACT_IMG_URLS_JS, [max_matches])
+    except Exception as e:
+        logger.debug("In-page URL extraction failed (%s), using page source", e)
+        return iter_image_urls_from_source(page.content(), max_matches)
+
+    return _iter_filtered_urls(raw_urls)
+
+
 def download_single_image(args: tuple) -> str | None:
     """Download a single image. Used by ThreadPoolExecutor.
 
     Args:
-        args: Tuple of (index, url, output_dir)
+        args: Tuple of (index, url, base_dir) where base_dir is the resolved
+            output directory as a string
 
     Returns:
         Path to downloaded file or None if failed
     """
-    idx, url, output_dir = args
+    idx, url, base_dir = args
 
     try:
         headers = {
@@ -272,14 +354,16 @@ def download_single_image(args: tuple) -> str | None:
             # Try to get from URL
             ext = Path(urllib.parse.urlparse(url).path).suffix or ".jpg"
 
-        output_path = output_dir / f"image_{idx:04d}{ext}"
+        filename = f"image_{idx:04d}{ext}"
+        output_path = f"{base_dir}/{filename}"
 
-        with open(output_path, "wb") as f:
+        # 1 MiB write buffer keeps write syscalls low for large images
+        with open(output_path, "wb", buffering=DOWNLOAD_WRITE_BUFFER) as f:
             for chunk in response.iter_content(chunk_size=8192):
                 f.write(chunk)
 
-        logger.debug("Downloaded: %s", output_path.name)
-        return str(output_path)
+        logger.debug("Downloaded: %s", filename)
+        return output_path
 
     except Exception as e:
         logger.debug("Failed to download %s: %s", url[:50], str(e)[:50])
@@ -347,6 +431,8 @@ class GoogleImage:
         "date_from": "df",
         "date_to": "dt",
     }
+    # Argparse specs derived from the fields below (populated at module bottom)
+    _FIELD_SPECS: ClassVar[list[tuple[str, list[str], dict]]] = []
 
     # Instance fields (order matters for positional args)
     keyword: str
@@ -374,16 +460,9 @@ class GoogleImage:
         """
         # Build search URL with size filter
         encoded_keyword = urllib.parse.quote(self.keyword)
-        size_param = SIZE_PARAMS.get(self.size, "isz:l")
-
-        # Build tbs parameter with multiple filters
-        tbs_parts = [size_param]
 
-        # Add time range filter
-        if self.time_range:
-            time_map = {"Day": "qdr:d", "Week": "qdr:w", "Month": "qdr:m", "Year": "qdr:y"}
-            if self.time_range in time_map:
-                tbs_parts.append(time_map[self.time_range])
+        # Size + time range filters come precomputed; only custom dates are dynamic
+        tbs_value = _TBS_CACHE.get((self.size, self.time_range)) or _build_tbs(self.size, self.time_range)
 
         # Add custom date range (Google format: cdr:1,cd_min:MM/DD/YYYY,cd_max:MM/DD/YYYY)
         if self.date_from or self.date_to:
@@ -396,9 +475,8 @@ class GoogleImage:
                 # Convert YYYYMMDD to MM/DD/YYYY
                 date_max = f"{self.date_to[4:6]}/{self.date_to[6:8]}/{self.date_to[:4]}"
                 date_parts.append(f"cd_max:{date_max}")
-            tbs_parts.append(",".join(date_parts))
+            tbs_value += "," + ",".join(date_parts)
 
-        tbs_value = ",".join(tbs_parts)
         search_url = f"https://www.google.com/search?q={encoded_keyword}&tbm=isch&tbs={tbs_value}"
 
         date_info = ""
@@ -408,7 +486,8 @@ class GoogleImage:
             date_info = f", date={self.date_from or 'any'} to {self.date_to or 'any'}"
 
         logger.info("Searching Google Images: '%s' (size=%s%s)", self.keyword, self.size, date_info)
-        page.goto(search_url)
+        # Don't block on the full load event (every thumbnail); the grid wait below is enough
+        page.goto(search_url, wait_until="domcontentloaded")
         self._wait_for_load(page)
 
         downloaded_files = []
@@ -430,6 +509,10 @@ class GoogleImage:
         2. Google regex extraction (fast, uses browser)
         3. Google with scrolling (slowest, most results)
 
+        Tiers 1 and 2 run concurrently: the DuckDuckGo request is issued on a
+        worker thread while the Google page source is extracted on this one.
+        DuckDuckGo results keep priority when the two are merged.
+
         Args:
             page: Playwright page instance (can be None for DuckDuckGo-only).
 
@@ -440,35 +523,52 @@ class GoogleImage:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         collected_urls = []
-
-        # Tier 1: Try DuckDuckGo first (fastest, no browser needed)
-        # Skip DuckDuckGo if custom date range is specified (not supported)
-        has_custom_date = self.date_from or self.date_to
-        if not has_custom_date:
-            logger.info("Trying DuckDuckGo search (no browser)...")
-            ddg_results = search_duckduckgo_images(
-                self.keyword, self.download, self.size, self.time_range
-            )
-            if ddg_results:
-                collected_urls = [r["url"] for r in ddg_results if r.get("url")]
-                logger.info("DuckDuckGo returned %d URLs", len(collected_urls))
-        else:
-            logger.info("Skipping DuckDuckGo (custom date range requires Google)")
-
-        # Tier 2: Fall back to Google regex extraction if DuckDuckGo fails or insufficient
-        if len(collected_urls) < self.download and page:
-            logger.info("Extracting from Google (regex)...")
-            html = page.content()
-            google_urls = extract_image_urls_from_source(html, self.download * 2)
-
-            # Add new URLs we haven't seen
-            seen = set(collected_urls)
+        seen = set()  # Dedupe across all tiers
+        google_urls = None
+        max_matches = self.download * 2 * _MAX_MATCHES_PER_URL
+
+        with ThreadPoolExecutor(max_workers=1) as search_executor:
+            # Tier 1: Start DuckDuckGo in the background (fastest, no browser needed)
+            # Skip DuckDuckGo if custom date range is specified (not supported)
+            ddg_future = None
+            has_custom_date = self.date_from or self.date_to
+            if not has_custom_date:
+                logger.info("Trying DuckDuckGo search (no browser)...")
+                ddg_future = search_executor.submit(
+                    search_duckduckgo_images,
+                    self.keyword, self.download, self.size, self.time_range,
+                )
+            else:
+                logger.info("Skipping DuckDuckGo (custom date range requires Google)")
+
+            # Tier 2: Google regex extraction while DuckDuckGo is in flight
+            # (stays on this thread - Playwright's sync API is not thread-safe)
+            if page:
+                logger.info("Extracting from Google (regex)...")
+                google_urls = iter_image_urls_from_page(page, max_matches)
+
+            if ddg_future:
+                ddg_results = ddg_future.result()
+                if ddg_results:
+                    for r in ddg_results:
+                        url = r.get("url")
+                        if url and url not in seen:
+                            seen.add(url)
+                            collected_urls.append(url)
+                    logger.info("DuckDuckGo returned %d URLs", len(collected_urls))
+
+        # Merge Google URLs after DuckDuckGo's, stopping once we have enough
+        if google_urls is not None and len(collected_urls) < self.download:
+            added = 0
             for url in google_urls:
                 if url not in seen:
-                    collected_urls.append(url)
                     seen.add(url)
+                    collected_urls.append(url)
+                    added += 1
+                    if len(collected_urls) >= self.download:
+                        break
 
-            logger.info("Google regex found %d additional URLs", len(google_urls))
+            logger.info("Google regex found %d additional URLs", added)
 
         # Tier 3: Scroll for more if still insufficient
         if len(collected_urls) < self.download and page:
@@ -481,14 +581,12 @@ class GoogleImage:
                 time.sleep(0.3)
                 scroll_count += 1
 
-                html = page.content()
-                new_urls = extract_image_urls_from_source(html, self.download * 2)
-
-                seen = set(collected_urls)
-                for url in new_urls:
+                for url in iter_image_urls_from_page(page, max_matches):
                     if url not in seen:
-                        collected_urls.append(url)
                         seen.add(url)
+                        collected_urls.append(url)
+                        if len(collected_urls) >= self.download:
+                            break
 
         # Trim to requested number
         urls_to_download = collected_urls[:self.download]
@@ -501,19 +599,16 @@ class GoogleImage:
                     len(urls_to_download), self.workers)
 
         # Download in parallel
-        downloaded_files = []
-        download_args = [(i, url, output_dir) for i, url in enumerate(urls_to_download)]
+        # Resolve the output directory once; workers format paths from this string
+        base_dir = str(output_dir.resolve())
+        download_args = [(i, url, base_dir) for i, url in enumerate(urls_to_download)]
 
         with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            futures = {
-                executor.submit(download_single_image, args): args[0]
-                for args in download_args
-            }
-
-            for future in as_completed(futures):
-                result = future.result()
-                if result:
-                    downloaded_files.append(result)
+            # map() yields results in input order, so files stay in search-rank order
+            downloaded_files = [
+                result for result in executor.map(download_single_image, download_args)
+                if result
+            ]
 
         success_rate = len(downloaded_files) / len(urls_to_download) * 100 if urls_to_download else 0
         logger.info("Downloaded %d/%d images (%.0f%%) to %s",
@@ -599,19 +694,19 @@ class GoogleImage:
                 browser.close()
 
     def _wait_for_load(self, page: Page, timeout: int = 5000) -> None:
-        """Wait for page to load - optimized with minimal delay.
+        """Wait for the first image tile to be attached to the DOM.
 
-        Uses smart waiting instead of fixed delays:
-        1. Wait for DOM content loaded
-        2. Wait for image grid to appear
+        A single event-driven wait: the grid selector can only match once the
+        DOM exists, so no separate domcontentloaded wait is needed.
         """
         try:
-            page.wait_for_load_state("domcontentloaded", timeout=timeout)
-            # Wait for Google Images grid to appear
-            page.wait_for_selector("div[data-ri]", timeout=timeout)
-        except Exception:
-            # Fallback: brief wait
-            time.sleep(1)
+            page.wait_for_selector(
+                "div[data-ri], g-scrolling-carousel img",
+                state="attached",
+                timeout=timeout,
+            )
+        except PlaywrightTimeout:
+            logger.debug("Image grid not found within %dms", timeout)
 
     def _take_screenshot(self, page: Page, output_path: str) -> None:
         """Take a screenshot of the current page."""
@@ -619,13 +714,13 @@ class GoogleImage:
         logger.info("Screenshot saved: %s", output_path)
 
     @classmethod
-    def add_to_parser(cls, subparsers) -> None:
-        """Add this command to argparse subparsers.
+    def _build_field_specs(cls) -> list[tuple[str, list[str], dict]]:
+        """Translate dataclass fields into argparse arguments.
 
-        Args:
-            subparsers: argparse subparsers object.
+        Returns:
+            List of (field name, argument names, add_argument kwargs) tuples.
         """
-        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
+        specs = []
 
         for name, fld in cls.__dataclass_fields__.items():
             if name.startswith("_"):
@@ -668,6 +763,20 @@ class GoogleImage:
             if fld.type is int:
                 kwargs["type"] = int
 
+            specs.append((name, names, kwargs))
+
+        return specs
+
+    @classmethod
+    def add_to_parser(cls, subparsers) -> None:
+        """Add this command to argparse subparsers.
+
+        Args:
+            subparsers: argparse subparsers object.
+        """
+        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
+
+        for _, names, kwargs in cls._FIELD_SPECS:
             parser.add_argument(*names, **kwargs)
 
     @classmethod
@@ -680,10 +789,13 @@ class GoogleImage:
         Returns:
             GoogleImage instance.
         """
-        kwargs = {}
-        for name in cls.__dataclass_fields__:
-            if name.startswith("_"):
-                continue
-            if hasattr(args, name):
-                kwargs[name] = getattr(args, name)
+        kwargs = {
+            name: getattr(args, name)
+            for name, _, _ in cls._FIELD_SPECS
+            if hasattr(args, name)
+        }
         return cls(**kwargs)
+
+
+# Field introspection runs once at import instead of on every CLI build
+GoogleImage._FIELD_SPECS = GoogleImage._build_field_specs()
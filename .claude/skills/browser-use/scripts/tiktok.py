@@ -32,53 +32,82 @@ Usage via browser.py:
     uv run browser.py tiktok-download "keyword" --search -n 5 -o ~/Downloads --no-headless
 """
 
+import atexit
 import dataclasses
 import json
 import logging
+import queue
 import re
-import subprocess
-import time
-import urllib.parse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, Callable, ClassVar
+from urllib.parse import urlencode
 
-from playwright.sync_api import sync_playwright, Page
+# Playwright is imported where it is used, so direct-URL downloads never pay
+# its import cost
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
 
 logger = logging.getLogger(__name__)
 
+TIKTOK_SEARCH_URL = "https://www.tiktok.com/search/video?"
 
-def _search_tiktok_playwright(
-    keyword: str,
-    num: int = 10,
-    headless: bool = True,
-    account: str | None = None,
-) -> list[dict]:
-    """Search TikTok videos using Playwright browser.
+# Total concurrent download streams (parallel workers x yt-dlp fragments)
+TIKTOK_CONNECTION_BUDGET = 8
 
-    TikTok requires browser automation for search since there's no
-    public API or yt-dlp search support like YouTube has.
 
-    Args:
-        keyword: Search query (hashtag or keyword)
-        num: Number of results to return
-        headless: Run browser in headless mode
-        account: Optional account name for authenticated context
+@lru_cache(maxsize=8)
+def _user_data_dir(account: str) -> Path:
+    """Return the persistent Chrome profile directory for an account."""
+    from browser import get_playwright_user_data_dir
+    return get_playwright_user_data_dir(account)
 
-    Returns:
-        List of video dictionaries with url, title, author, views, likes
+
+# Accounts whose profile directory is known to exist. Only positive results
+# are cached, so a profile created later in the process is still picked up.
+_existing_profiles: set[str] = set()
+
+
+def _profile_exists(account: str) -> bool:
+    """Check whether a login profile has been saved for an account."""
+    if account in _existing_profiles:
+        return True
+    if _user_data_dir(account).exists():
+        _existing_profiles.add(account)
+        return True
+    return False
+
+
+class _TikTokPagePool:
+    """Keeps TikTok browser contexts alive across searches in one process.
+
+    Launching Chrome costs 1-3s, so contexts are created once per
+    (account, headless) pair and pages are handed out with acquire() and
+    returned with release(). Like all Playwright sync objects, the pool must
+    only be used from the thread that first acquired a page.
     """
-    # Clean keyword - remove # prefix if present for URL
-    search_keyword = keyword.lstrip("#")
-    encoded_keyword = urllib.parse.quote(search_keyword)
 
-    # TikTok search URL
-    search_url = f"https://www.tiktok.com/search/video?q={encoded_keyword}"
+    def __init__(self) -> None:
+        self._playwright = None
+        self._browsers = []
+        self._contexts: dict[tuple[str | None, bool], "BrowserContext"] = {}
+        self._idle: dict[tuple[str | None, bool], list["Page"]] = {}
 
-    results = []
+    def _get_context(self, key: tuple[str | None, bool]) -> "BrowserContext":
+        """Return the context for key, launching the browser on first use."""
+        context = self._contexts.get(key)
+        if context is not None:
+            return context
+
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+
+        account, headless = key
 
-    with sync_playwright() as p:
         # Launch browser with stealth settings
         # TikTok blocks headless browsers heavily, so we use real Chrome channel
         browser_args = [
@@ -89,208 +118,417 @@ def _search_tiktok_playwright(
         ]
 
         if account:
-            from browser import get_playwright_user_data_dir
-            user_data_dir = get_playwright_user_data_dir(account)
-            if not user_data_dir.exists():
-                logger.warning("Account '%s' not found. Run 'create-login' first.", account)
-                return []
-            context = p.chromium.launch_persistent_context(
-                str(user_data_dir),
+            context = self._playwright.chromium.launch_persistent_context(
+                str(_user_data_dir(account)),
                 headless=headless,
                 channel="chrome",
                 args=browser_args + ["--start-maximized"],
                 no_viewport=True,  # Allow maximized window
                 ignore_default_args=["--enable-automation"],
             )
-            page = context.pages[0] if context.pages else context.new_page()
+            # Persistent contexts open with a blank page we can hand out
+            self._idle[key] = list(context.pages)
         else:
             # Use Chrome channel for better TikTok compatibility
-            browser = p.chromium.launch(
+            browser = self._playwright.chromium.launch(
                 headless=headless,
                 channel="chrome",  # Use real Chrome instead of Chromium
                 args=browser_args,
             )
+            self._browsers.append(browser)
             context = browser.new_context(
                 viewport={"width": 1920, "height": 1080},
                 user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
             )
-            page = context.new_page()
 
-            # Add stealth script to hide automation
-            page.add_init_script("""
+            # Add stealth script to hide automation (applies to every page)
+            context.add_init_script("""
                 Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
             """)
+            self._idle[key] = []
 
-        try:
-            logger.info("Searching TikTok: '%s'", keyword)
-            page.goto(search_url, timeout=60000)
+        self._contexts[key] = context
+        return context
+
+    def acquire(self, account: str | None, headless: bool) -> "Page":
+        """Return an idle page for the given account/headless combination.
+
+        Args:
+            account: Optional account name for authenticated context
+            headless: Run browser in headless mode
 
-            # Wait for page to load - TikTok is heavily JS-rendered
+        Returns:
+            Playwright page ready for navigation
+        """
+        key = (account, headless)
+        context = self._get_context(key)
+        idle = self._idle[key]
+        while idle:
+            page = idle.pop()
+            if not page.is_closed():
+                return page
+        return context.new_page()
+
+    def release(self, page: "Page") -> None:
+        """Reset a page and make it available to the next acquire()."""
+        key = next((k for k, c in self._contexts.items() if c is page.context), None)
+        if key is None or page.is_closed():
+            return
+        try:
+            page.goto("about:blank")
+        except Exception:
+            # Context is gone (e.g. the user closed the window); relaunch next time
+            self._contexts.pop(key, None)
+            self._idle.pop(key, None)
+            return
+        self._idle[key].append(page)
+
+    def shutdown(self) -> None:
+        """Close all contexts and browsers and stop Playwright."""
+        for context in self._contexts.values():
             try:
-                page.wait_for_load_state("domcontentloaded", timeout=15000)
+                context.close()
             except Exception:
                 pass
-
-            # Additional wait for JS to render content
-            time.sleep(3)
-
-            # Handle cookie consent if present
+        for browser in self._browsers:
             try:
-                accept_btn = page.locator("button:has-text('Accept all')").first
-                if accept_btn.is_visible(timeout=2000):
-                    accept_btn.click()
-                    time.sleep(0.5)
+                browser.close()
             except Exception:
                 pass
-
-            # Verify we're on the search page, not activity page
-            current_url = page.url
-            if "/search/" not in current_url:
-                logger.warning("Not on search page, navigating again...")
-                page.goto(search_url, timeout=60000)
-                time.sleep(3)
-
-            # Try to wait for video elements to appear
+        if self._playwright is not None:
             try:
-                page.wait_for_selector('a[href*="/video/"]', timeout=10000)
+                self._playwright.stop()
             except Exception:
-                logger.debug("No video links found immediately, will try scrolling")
-                time.sleep(2)
+                pass
+        self._contexts.clear()
+        self._idle.clear()
+        self._browsers.clear()
+        self._playwright = None
+
+
+_page_pool = _TikTokPagePool()
+atexit.register(_page_pool.shutdown)
+
+
+def _search_tiktok_playwright(
+    keyword: str,
+    num: int = 10,
+    headless: bool = True,
+    account: str | None = None,
+    on_result: Callable[[dict], None] | None = None,
+) -> list[dict]:
+    """Search TikTok videos using Playwright browser.
+
+    TikTok requires browser automation for search since there's no
+    public API or yt-dlp search support like YouTube has.
+
+    Args:
+        keyword: Search query (hashtag or keyword)
+        num: Number of results to return
+        headless: Run browser in headless mode
+        account: Optional account name for authenticated context
+        on_result: Optional callback invoked with each video as it is found
+
+    Returns:
+        List of video dictionaries with url, title, author, views, likes
+    """
+    # TikTok search URL (remove # prefix if present)
+    search_url = TIKTOK_SEARCH_URL + urlencode({"q": keyword.lstrip("#")})
+
+    if account:
+        if not _profile_exists(account):
+            logger.warning("Account '%s' not found. Run 'create-login' first.", account)
+            return []
+
+    results = []
+    page = _page_pool.acquire(account, headless)
+
+    try:
+        logger.info("Searching TikTok: '%s'", keyword)
+        page.goto(search_url, timeout=60000)
+
+        # Wait for page to load - TikTok is heavily JS-rendered
+        try:
+            page.wait_for_load_state("domcontentloaded", timeout=15000)
+        except Exception:
+            pass
+
+        _wait_for_video_links(page)
+
+        # Handle cookie consent if present
+        # (count() is a single DOM query, no retry loop when there is no banner)
+        try:
+            accept_btn = page.locator("button:has-text('Accept all')").first
+            if accept_btn.count():
+                accept_btn.click()
+                page.wait_for_timeout(200)
+        except Exception:
+            pass
+
+        # Verify we're on the search page, not activity page
+        current_url = page.url
+        if "/search/" not in current_url:
+            logger.warning("Not on search page, navigating again...")
+            page.goto(search_url, timeout=60000)
+            _wait_for_video_links(page)
 
-            # Scroll and collect videos
-            results = _extract_tiktok_videos(page, num)
+        # Scroll and collect videos
+        results = _extract_tiktok_videos(page, num, on_result=on_result)
 
-        except Exception as e:
-            logger.error("TikTok search failed: %s", e)
-        finally:
-            context.close()
+    except Exception as e:
+        logger.error("TikTok search failed: %s", e)
+    finally:
+        _page_pool.release(page)
 
     return results
 
 
-def _extract_tiktok_videos(page: Page, num: int) -> list[dict]:
+def _wait_for_video_links(page: "Page") -> None:
+    """Wait until search results are rendered instead of sleeping a fixed time.
+
+    Args:
+        page: Playwright page navigated to the search URL
+    """
+    try:
+        page.wait_for_selector('a[href*="/video/"]', state="attached", timeout=5000)
+    except Exception:
+        logger.debug("No video links found immediately, will try scrolling")
+        return
+
+    # Let the first batch of results settle, but never wait long for it
+    try:
+        page.wait_for_load_state("networkidle", timeout=2000)
+    except Exception:
+        pass
+
+
+# Relative upload dates shown on result cards, e.g. "1d ago", "2h ago", "10-29"
+_TT_DATE_PATTERN = r"([0-9]+[hdwm] *ago|[0-9]{1,2}-[0-9]{1,2})"
+
+# Installs a persistent collector on the search page. It remembers every video
+# link already seen and queues only new ones in window.__tt_new, so each poll
+# transfers just the videos that appeared since the previous one. Collection
+# stops once `limit` videos have been found.
+_TT_COLLECTOR_JS = """
+(limit) => {
+    window.__tt_limit = limit;
+    if (window.__tt_seen) return;
+
+    window.__tt_seen = new Set();
+    window.__tt_new = [];
+    window.__tt_results = [];
+
+    const DATE_RE = /%s/i;
+
+    const extract = (link, href, url) => {
+        // Try to find parent container
+        const container = link.closest('[class*="DivItemContainer"]') ||
+                          link.closest('[class*="DivWrapper"]') ||
+                          link.closest('[class*="ItemContainer"]') ||
+                          link.parentElement?.parentElement?.parentElement;
+
+        // Extract author from URL pattern /@username/video/
+        let author = '';
+        const authorMatch = href.match(/@([^/]+)[/]video/);
+        if (authorMatch) {
+            author = authorMatch[1];
+        }
+
+        // Extract description from container or nearby elements
+        let title = '';
+        if (container) {
+            // Look for description elements
+            const descElem = container.querySelector('[class*="Desc"]') ||
+                            container.querySelector('[class*="Caption"]') ||
+                            container.querySelector('span[class*="SpanText"]');
+            if (descElem) {
+                title = descElem.textContent?.trim()?.slice(0, 200) || '';
+            }
+        }
+
+        // Extract stats if available
+        let views = '';
+        let likes = '';
+        let date = '';
+        if (container) {
+            const strongElems = container.querySelectorAll('strong');
+            strongElems.forEach((s, i) => {
+                const text = s.textContent || '';
+                if (i === 0) likes = text;
+                else if (i === 1) views = text;
+            });
+
+            // Extract date - look for relative time patterns
+            const containerText = container.textContent || '';
+            const dateMatch = containerText.match(DATE_RE);
+            if (dateMatch) {
+                date = dateMatch[1];
+            }
+        }
+
+        return { url, title, author, views, likes, date };
+    };
+
+    const scan = () => {
+        if (window.__tt_results.length >= window.__tt_limit) return;
+
+        for (const link of document.querySelectorAll('a[href*="/video/"]')) {
+            const href = link.getAttribute('href');
+            if (!href || !href.includes('/video/')) continue;
+
+            const url = href.startsWith('http') ? href : 'https://www.tiktok.com' + href;
+            if (window.__tt_seen.has(url)) continue;
+            window.__tt_seen.add(url);
+
+            const video = extract(link, href, url);
+            window.__tt_new.push(video);
+            window.__tt_results.push(video);
+            if (window.__tt_results.length >= window.__tt_limit) break;
+        }
+    };
+
+    // Coalesce bursts of DOM mutations into one scan
+    let pending = false;
+    const schedule = () => {
+        if (pending) return;
+        pending = true;
+        setTimeout(() => { pending = false; scan(); }, 100);
+    };
+    new MutationObserver(schedule).observe(document.body, { childList: true, subtree: true });
+    window.addEventListener('scroll', schedule, { passive: true });
+
+    window.__tt_scan = scan;
+    scan();
+}
+""" % _TT_DATE_PATTERN
+
+# Returns (and clears) the videos collected since the previous call. The batch
+# is sent as one JSON string, which crosses CDP much faster than an array of
+# objects that is marshaled property by property.
+_TT_DRAIN_JS = """
+() => {
+    window.__tt_scan();
+    return JSON.stringify(window.__tt_new.splice(0));
+}
+"""
+
+
+def _extract_tiktok_videos(
+    page: "Page",
+    num: int,
+    on_result: Callable[[dict], None] | None = None,
+) -> list[dict]:
     """Extract video information from TikTok search results.
 
+    Installs an in-page collector once, then each scroll waits only until new
+    videos render and transfers just those instead of re-reading every link
+    on the page.
+
     Args:
         page: Playwright page with search results loaded
         num: Maximum number of videos to extract
+        on_result: Optional callback invoked with each video as it is found
 
     Returns:
         List of video dictionaries
     """
     results = []
-    seen_urls = set()
     max_scrolls = 20
+    max_stale_scrolls = 2  # Stop once scrolling stops producing new videos
     scroll_count = 0
+    stale_count = 0
 
-    while len(results) < num and scroll_count < max_scrolls:
-        # Extract videos using JavaScript evaluation (faster than Playwright locators)
-        videos_data = page.evaluate("""
-            () => {
-                const videos = [];
-
-                // Method 1: Find all video links directly
-                const allLinks = document.querySelectorAll('a[href*="/video/"]');
-                const seen = new Set();
-
-                allLinks.forEach(link => {
-                    const href = link.getAttribute('href');
-                    if (!href || !href.includes('/video/')) return;
-
-                    const url = href.startsWith('http') ? href : 'https://www.tiktok.com' + href;
-                    if (seen.has(url)) return;
-                    seen.add(url);
-
-                    // Try to find parent container
-                    let container = link.closest('[class*="DivItemContainer"]') ||
-                                   link.closest('[class*="DivWrapper"]') ||
-                                   link.closest('[class*="ItemContainer"]') ||
-                                   link.parentElement?.parentElement?.parentElement;
-
-                    // Extract author from URL pattern /@username/video/
-                    let author = '';
-                    const authorMatch = href.match(/@([^/]+)[/]video/);
-                    if (authorMatch) {
-                        author = authorMatch[1];
-                    }
-
-                    // Extract description from container or nearby elements
-                    let title = '';
-                    if (container) {
-                        // Look for description elements
-                        const descElem = container.querySelector('[class*="Desc"]') ||
-                                        container.querySelector('[class*="Caption"]') ||
-                                        container.querySelector('span[class*="SpanText"]');
-                        if (descElem) {
-                            title = descElem.textContent?.trim()?.slice(0, 200) || '';
-                        }
-                    }
-
-                    // Extract stats if available
-                    let views = '';
-                    let likes = '';
-                    let date = '';
-                    if (container) {
-                        const strongElems = container.querySelectorAll('strong');
-                        strongElems.forEach((s, i) => {
-                            const text = s.textContent || '';
-                            if (i === 0) likes = text;
-                            else if (i === 1) views = text;
-                        });
-
-                        // Extract date - look for relative time patterns
-                        const containerText = container.textContent || '';
-                        // Match patterns like "1d ago", "2h ago", "3w ago", "10-29", "8-4"
-                        const dateMatch = containerText.match(/([0-9]+[hdwm] *ago|[0-9]{1,2}-[0-9]{1,2})/i);
-                        if (dateMatch) {
-                            date = dateMatch[1];
-                        }
-                    }
-
-                    videos.push({ url, title, author, views, likes, date });
-                });
-
-                return videos;
-            }
-        """)
-
-        # Process extracted videos
-        for v in videos_data:
-            url = v.get("url", "")
-            if not url or url in seen_urls:
-                continue
-            if "/video/" not in url:
-                continue
-
-            seen_urls.add(url)
-            results.append({
-                "url": url,
-                "title": v.get("title", "")[:200],
-                "author": v.get("author", ""),
-                "views": v.get("views", ""),
-                "likes": v.get("likes", ""),
-                "date": v.get("date", ""),
-            })
+    page.evaluate(_TT_COLLECTOR_JS, num)
+    videos_data = json.loads(page.evaluate(_TT_DRAIN_JS))
 
-            if len(results) >= num:
-                break
+    while True:
+        # New videos arrive deduplicated and capped at num by the collector
+        results.extend(videos_data)
+        if on_result:
+            for video in videos_data:
+                on_result(video)
 
-        if len(results) >= num:
+        if len(results) >= num or scroll_count >= max_scrolls:
+            break
+        if stale_count >= max_stale_scrolls:
+            logger.debug("No new videos after %d scrolls, stopping", stale_count)
             break
 
-        # Scroll for more results
+        # Scroll for more results and continue as soon as new videos render
         page.evaluate("window.scrollBy(0, window.innerHeight * 2)")
-        time.sleep(0.5)
+        try:
+            page.wait_for_function(
+                f"() => (window.__tt_results?.length || 0) > {len(results)}",
+                timeout=1500,
+            )
+        except Exception:
+            page.wait_for_timeout(300)
+        videos_data = json.loads(page.evaluate(_TT_DRAIN_JS))
+        stale_count = 0 if videos_data else stale_count + 1
         scroll_count += 1
         logger.debug("Scroll %d: found %d/%d videos", scroll_count, len(results), num)
 
     logger.info("Found %d TikTok videos", len(results))
-    return results[:num]
+    return results
+
+
+_VIDEO_ID_RE = re.compile(r"/video/(\d+)")
+
+
+def _tiktok_video_id(url: str) -> str | None:
+    """Extract the numeric video ID from a TikTok video URL."""
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# One YoutubeDL instance per worker thread and option set; YoutubeDL is not
+# safe to share between threads but is cheap to reuse within one.
+_ydl_local = threading.local()
+
+
+def _get_tiktok_ydl(output_dir: Path, concurrent_fragments: int):
+    """Return this thread's YoutubeDL instance for the given options.
+
+    Args:
+        output_dir: Directory to save videos
+        concurrent_fragments: Number of concurrent fragment downloads
+
+    Returns:
+        yt_dlp.YoutubeDL instance
+
+    Raises:
+        ImportError: If yt-dlp is not installed
+    """
+    instances = getattr(_ydl_local, "instances", None)
+    if instances is None:
+        instances = _ydl_local.instances = {}
+
+    key = (str(output_dir), concurrent_fragments)
+    ydl = instances.get(key)
+    if ydl is None:
+        from yt_dlp import YoutubeDL
+
+        ydl = instances[key] = YoutubeDL({
+            "format": "best",  # TikTok usually has single format
+            "outtmpl": str(output_dir / "%(uploader)s_%(id)s.%(ext)s"),
+            "noplaylist": True,
+            "restrictfilenames": True,
+            "updatetime": False,  # Same as --no-mtime
+            "concurrent_fragment_downloads": concurrent_fragments,
+            "socket_timeout": 30,
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+        })
+    return ydl
 
 
 def _download_tiktok_video(url: str, output_dir: Path, concurrent_fragments: int = 4) -> str | None:
     """Download a single TikTok video using yt-dlp.
 
+    Runs yt-dlp in-process (no subprocess per video) and takes the final
+    output path from the returned info dict rather than parsing log output.
+
     Args:
         url: TikTok video URL
         output_dir: Directory to save video
@@ -299,65 +537,118 @@ def _download_tiktok_video(url: str, output_dir: Path, concurrent_fragments: int
     Returns:
         Path to downloaded file or None if failed
     """
-    cmd = [
-        "yt-dlp",
-        "-f", "best",  # TikTok usually has single format
-        "-o", str(output_dir / "%(uploader)s_%(id)s.%(ext)s"),
-        "--no-playlist",
-        "--restrict-filenames",
-        "--no-mtime",
-        "-N", str(concurrent_fragments),
-        url,
-    ]
+    # Output template is %(uploader)s_%(id)s.%(ext)s, so an existing file for
+    # this ID means the video was already downloaded
+    video_id = _tiktok_video_id(url)
+    if video_id:
+        existing = next(iter(output_dir.glob(f"*_{video_id}.mp4")), None)
+        if existing:
+            logger.info("Already exists: %s", existing.name)
+            return str(existing)
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
+        ydl = _get_tiktok_ydl(output_dir, concurrent_fragments)
+    except ImportError:
+        logger.error("yt-dlp not found. Install with: uv add yt-dlp")
+        return None
 
-        if result.returncode == 0:
-            # Try to extract downloaded filename from output
-            for line in result.stdout.split("\n"):
-                if "Destination:" in line:
-                    match = re.search(r"Destination: (.+)$", line)
-                    if match:
-                        filepath = match.group(1)
-                        logger.info("Downloaded: %s", Path(filepath).name)
-                        return filepath
-                if "has already been downloaded" in line:
-                    match = re.search(r"\[download\] (.+) has already been downloaded", line)
-                    if match:
-                        filepath = match.group(1)
-                        logger.info("Already exists: %s", Path(filepath).name)
-                        return filepath
-
-            # Find most recently modified file in output dir
-            files = list(output_dir.glob("*.mp4"))
-            if files:
-                newest = max(files, key=lambda f: f.stat().st_mtime)
-                logger.info("Downloaded: %s", newest.name)
-                return str(newest)
-
-            logger.info("Download completed")
-            return str(output_dir)
-        else:
-            logger.error("yt-dlp error: %s", result.stderr[:200])
+    try:
+        info = ydl.extract_info(url, download=True)
+        if not info:
+            logger.error("yt-dlp error: no video info for %s", url)
             return None
 
-    except subprocess.TimeoutExpired:
-        logger.error("Download timed out: %s", url)
-        return None
-    except FileNotFoundError:
-        logger.error("yt-dlp not found. Install with: uv add yt-dlp")
-        return None
+        # requested_downloads holds the final path after any post-processing
+        # moves (what --print after_move:filepath reports); prepare_filename
+        # is only the pre-download template expansion
+        downloads = info.get("requested_downloads") or [{}]
+        filepath = downloads[-1].get("filepath") or ydl.prepare_filename(info)
+        logger.info("Downloaded: %s", Path(filepath).name)
+        return filepath
+
     except Exception as e:
-        logger.error("Download error: %s", e)
+        logger.error("Download error: %s", str(e)[:200])
         return None
 
 
+def _compute_cli_spec(cls) -> list[tuple[list[str], dict]]:
+    """Build the argparse arguments for a dataclass command.
+
+    Required fields become positionals, unless the class sets
+    _cli_required_as_option, in which case they are required --options.
+
+    Args:
+        cls: Dataclass command class with _cli_* metadata
+
+    Returns:
+        List of (names, kwargs) pairs for parser.add_argument
+    """
+    spec = []
+    required_as_option = getattr(cls, "_cli_required_as_option", False)
+
+    for name, fld in cls.__dataclass_fields__.items():
+        if name.startswith("_"):
+            continue
+
+        help_text = cls._cli_help.get(name, "")
+        is_required = fld.default is dataclasses.MISSING
+        default = fld.default if not is_required else None
+        short = cls._cli_short.get(name)
+
+        if is_required and not required_as_option:
+            names = [name]
+        else:
+            names = [f"--{name}"]
+            if short:
+                names.insert(0, f"-{short}")
+
+        kwargs = {"help": help_text}
+
+        if not is_required:
+            kwargs["default"] = default
+        elif required_as_option:
+            kwargs["required"] = True
+
+        if name in cls._cli_choices:
+            kwargs["choices"] = cls._cli_choices[name]
+
+        if fld.type is bool:
+            kwargs.pop("required", None)
+            if default is True:
+                names = [f"--no-{name}"]
+                kwargs["action"] = "store_false"
+                kwargs["dest"] = name
+                kwargs.pop("default", None)
+            else:
+                kwargs["action"] = "store_true"
+
+        if fld.type is int:
+            kwargs["type"] = int
+
+        spec.append((names, kwargs))
+
+    return spec
+
+
+def _add_dataclass_cli(cls, subparsers) -> None:
+    """Add a dataclass command to argparse subparsers.
+
+    The argument spec is computed once per class and cached on it.
+
+    Args:
+        cls: Dataclass command class with _cli_* metadata
+        subparsers: argparse subparsers action
+    """
+    spec = cls.__dict__.get("_cli_spec_cache")
+    if spec is None:
+        spec = _compute_cli_spec(cls)
+        cls._cli_spec_cache = spec
+
+    parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
+    for names, kwargs in spec:
+        parser.add_argument(*names, **kwargs)
+
+
 @dataclass
 class TikTokSearch:
     """TikTok video search using Playwright.
@@ -424,45 +715,7 @@ class TikTokSearch:
     @classmethod
     def add_to_parser(cls, subparsers) -> None:
         """Add this command to argparse subparsers."""
-        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
-
-        for name, fld in cls.__dataclass_fields__.items():
-            if name.startswith("_"):
-                continue
-
-            help_text = cls._cli_help.get(name, "")
-            is_required = fld.default is dataclasses.MISSING
-            default = fld.default if not is_required else None
-            short = cls._cli_short.get(name)
-
-            if is_required:
-                names = [name]
-            else:
-                names = [f"--{name}"]
-                if short:
-                    names.insert(0, f"-{short}")
-
-            kwargs = {"help": help_text}
-
-            if not is_required:
-                kwargs["default"] = default
-
-            if name in cls._cli_choices:
-                kwargs["choices"] = cls._cli_choices[name]
-
-            if fld.type is bool or (hasattr(fld, "type") and fld.type is bool):
-                if default is True:
-                    names = [f"--no-{name}"]
-                    kwargs["action"] = "store_false"
-                    kwargs["dest"] = name
-                    kwargs.pop("default", None)
-                else:
-                    kwargs["action"] = "store_true"
-
-            if fld.type is int:
-                kwargs["type"] = int
-
-            parser.add_argument(*names, **kwargs)
+        _add_dataclass_cli(cls, subparsers)
 
     @classmethod
     def from_args(cls, args) -> "TikTokSearch":
@@ -527,99 +780,81 @@ class TikTokDownload:
         output_path = Path(self.output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
-        urls_to_download = []
+        downloaded_files = []
 
-        # Search mode: find video URLs first
+        # Search mode: download videos while the search is still scrolling
         if self.search:
             logger.info("Searching TikTok for: %s", self.url)
 
-            results = _search_tiktok_playwright(
-                keyword=self.url,
-                num=self.num,
-                headless=self.headless,
-                account=self.account,
-            )
-
-            if not results:
-                logger.warning("No videos found for search query")
-                return []
+            workers = max(1, self.parallel)
+            # Keep workers x fragments within a fixed connection budget;
+            # more streams than that just gets throttled by TikTok
+            frags = max(1, TIKTOK_CONNECTION_BUDGET // workers)
+            url_queue: queue.Queue[str | None] = queue.Queue()
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                worker_results = executor.map(
+                    lambda _: self._download_worker(url_queue, output_path, frags),
+                    range(workers),
+                )
+                try:
+                    results = _search_tiktok_playwright(
+                        keyword=self.url,
+                        num=self.num,
+                        headless=self.headless,
+                        account=self.account,
+                        on_result=lambda v: url_queue.put(v["url"]),
+                    )
+                finally:
+                    # One sentinel per worker so every worker exits
+                    for _ in range(workers):
+                        url_queue.put(None)
+
+                if not results:
+                    logger.warning("No videos found for search query")
+                else:
+                    logger.info("Found %d videos to download", len(results))
 
-            urls_to_download = [r["url"] for r in results[:self.num]]
-            logger.info("Found %d videos to download", len(urls_to_download))
+                for files in worker_results:
+                    downloaded_files.extend(files)
         else:
             # Direct URL mode
-            urls_to_download = [self.url]
-
-        downloaded_files = []
-
-        # Download videos
-        if len(urls_to_download) > 1 and self.parallel > 1:
-            # Parallel downloads for multiple videos
-            logger.info("Downloading %d videos with %d parallel workers...",
-                       len(urls_to_download), self.parallel)
-
-            with ThreadPoolExecutor(max_workers=self.parallel) as executor:
-                futures = {
-                    executor.submit(_download_tiktok_video, url, output_path): url
-                    for url in urls_to_download
-                }
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result:
-                        downloaded_files.append(result)
-        else:
-            # Sequential download
-            for url in urls_to_download:
-                logger.info("Downloading: %s", url)
-                result = _download_tiktok_video(url, output_path)
-                if result:
-                    downloaded_files.append(result)
+            logger.info("Downloading: %s", self.url)
+            result = _download_tiktok_video(self.url, output_path)
+            if result:
+                downloaded_files.append(result)
 
         logger.info("Downloaded %d file(s) to %s", len(downloaded_files), output_path)
         return downloaded_files
 
-    @classmethod
-    def add_to_parser(cls, subparsers) -> None:
-        """Add this command to argparse subparsers."""
-        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
-
-        for name, fld in cls.__dataclass_fields__.items():
-            if name.startswith("_"):
-                continue
+    @staticmethod
+    def _download_worker(
+        url_queue: queue.Queue, output_path: Path, concurrent_fragments: int
+    ) -> list[str]:
+        """Download URLs from the queue until a None sentinel arrives.
 
-            help_text = cls._cli_help.get(name, "")
-            is_required = fld.default is dataclasses.MISSING
-            default = fld.default if not is_required else None
-            short = cls._cli_short.get(name)
+        Args:
+            url_queue: Queue fed with video URLs by the search
+            output_path: Directory to save videos
+            concurrent_fragments: Number of concurrent fragment downloads
 
-            if is_required:
-                names = [name]
-            else:
-                names = [f"--{name}"]
-                if short:
-                    names.insert(0, f"-{short}")
-
-            kwargs = {"help": help_text}
-
-            if not is_required:
-                kwargs["default"] = default
-
-            if name in cls._cli_choices:
-                kwargs["choices"] = cls._cli_choices[name]
-
-            if fld.type is bool or (hasattr(fld, "type") and fld.type is bool):
-                if default is True:
-                    names = [f"--no-{name}"]
-                    kwargs["action"] = "store_false"
-                    kwargs["dest"] = name
-                    kwargs.pop("default", None)
-                else:
-                    kwargs["action"] = "store_true"
-
-            if fld.type is int:
-                kwargs["type"] = int
+        Returns:
+            List of downloaded file paths
+        """
+        downloaded = []
+        while True:
+            url = url_queue.get()
+            if url is None:
+                return downloaded
+            logger.info("Downloading: %s", url)
+            result = _download_tiktok_video(url, output_path, concurrent_fragments)
+            if result:
+                downloaded.append(result)
 
-            parser.add_argument(*names, **kwargs)
+    @classmethod
+    def add_to_parser(cls, subparsers) -> None:
+        """Add this command to argparse subparsers."""
+        _add_dataclass_cli(cls, subparsers)
 
     @classmethod
     def from_args(cls, args) -> "TikTokDownload":
@@ -658,6 +893,7 @@ class TikTokLogin:
         "account": "a",
         "wait": "w",
     }
+    _cli_required_as_option: ClassVar[bool] = True
 
     # Instance fields
     account: str
@@ -670,6 +906,7 @@ class TikTokLogin:
             True if login was successful, False otherwise
         """
         from browser import get_playwright_user_data_dir, ensure_auth_dir
+        from playwright.sync_api import sync_playwright
 
         ensure_auth_dir()
 
@@ -707,23 +944,23 @@ class TikTokLogin:
             logger.info("Session will be saved in %d seconds...", self.wait)
             logger.info("(Or close the browser when done)")
 
-            # Wait for login or timeout
-            elapsed = 0
-            while elapsed < self.wait and not page.is_closed():
-                time.sleep(1)
-                elapsed += 1
-                remaining = self.wait - elapsed
-                if remaining > 0 and remaining % 30 == 0:
-                    logger.info("  %d seconds remaining...", remaining)
-
-                # Check if logged in by looking for profile elements
+            # Wait for login or timeout. The profile icon (user avatar) only
+            # shows once logged in; wait for it in 30s slices so progress is
+            # still reported without polling every second.
+            remaining = self.wait
+            while remaining > 0 and not page.is_closed():
+                slice_seconds = min(30, remaining)
                 try:
-                    # If we can find the user avatar or profile link, login succeeded
-                    if page.locator('[data-e2e="profile-icon"]').is_visible(timeout=500):
-                        logger.info("Login detected! Saving session...")
-                        break
+                    page.wait_for_selector(
+                        '[data-e2e="profile-icon"]', timeout=slice_seconds * 1000
+                    )
+                    logger.info("Login detected! Saving session...")
+                    break
                 except Exception:
                     pass
+                remaining -= slice_seconds
+                if remaining > 0 and not page.is_closed():
+                    logger.info("  %d seconds remaining...", remaining)
 
             # Close context (profile is auto-saved)
             if context.pages:
@@ -738,50 +975,7 @@ class TikTokLogin:
     @classmethod
     def add_to_parser(cls, subparsers) -> None:
         """Add this command to argparse subparsers."""
-        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
-
-        for name, fld in cls.__dataclass_fields__.items():
-            if name.startswith("_"):
-                continue
-
-            help_text = cls._cli_help.get(name, "")
-            is_required = fld.default is dataclasses.MISSING
-            default = fld.default if not is_required else None
-            short = cls._cli_short.get(name)
-
-            if is_required:
-                names = [f"--{name}"]  # account is required but as --account
-                if short:
-                    names.insert(0, f"-{short}")
-            else:
-                names = [f"--{name}"]
-                if short:
-                    names.insert(0, f"-{short}")
-
-            kwargs = {"help": help_text, "required": is_required}
-
-            if not is_required:
-                kwargs["default"] = default
-                kwargs.pop("required", None)
-
-            if name in cls._cli_choices:
-                kwargs["choices"] = cls._cli_choices[name]
-
-            if fld.type is bool or (hasattr(fld, "type") and fld.type is bool):
-                if default is True:
-                    names = [f"--no-{name}"]
-                    kwargs["action"] = "store_false"
-                    kwargs["dest"] = name
-                    kwargs.pop("default", None)
-                    kwargs.pop("required", None)
-                else:
-                    kwargs["action"] = "store_true"
-                    kwargs.pop("required", None)
-
-            if fld.type is int:
-                kwargs["type"] = int
-
-            parser.add_argument(*names, **kwargs)
+        _add_dataclass_cli(cls, subparsers)
 
     @classmethod
     def from_args(cls, args) -> "TikTokLogin":
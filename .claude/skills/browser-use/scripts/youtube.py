@@ -17,18 +17,28 @@ Usage via browser.py:
     uv run browser.py youtube-download "keyword" --search -o ./downloads
 """
 
+import asyncio
+import atexit
 import dataclasses
+import gzip
+import hashlib
 import json
 import logging
 import re
 import shutil
+import sqlite3
 import subprocess
+import threading
 import time
+import types
+import typing
 import urllib.parse
+import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing
 from dataclasses import dataclass
 from pathlib import Path
-from typing import ClassVar, Literal
+from typing import ClassVar, Iterator, Literal
 
 from playwright.sync_api import sync_playwright, Page
 
@@ -37,40 +47,181 @@ logger = logging.getLogger(__name__)
 # Check if aria2c is available for faster downloads
 ARIA2C_AVAILABLE = shutil.which("aria2c") is not None
 
+# aria2c tuning: 16 connections per file; -k 1M (min split size) is what
+# actually lets it open that many, otherwise it stays at ~4
+ARIA2C_ARGS = "-x 16 -s 16 -k 1M --max-tries=5 --retry-wait=5 --file-allocation=none"
 
-def _search_ytdlp_fast(
+# On-disk cache of search results, so repeating a query skips the network
+SEARCH_CACHE_PATH = Path.home() / ".cache" / "browser-use" / "yt_search.sqlite"
+SEARCH_CACHE_TTL = 3600  # seconds
+
+
+class _CacheStore:
+    """Small SQLite store mapping a search key to its JSON-encoded results.
+
+    Cache errors are never fatal: a failed read is treated as a miss and a
+    failed write is skipped.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL, payload TEXT)"
+            )
+        return self._conn
+
+    def get(self, key: str, max_age: float = SEARCH_CACHE_TTL) -> list[dict] | None:
+        """Return cached results for key, or None if missing or older than max_age."""
+        try:
+            row = self._connect().execute(
+                "SELECT ts, payload FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Search cache read failed: %s", e)
+            return None
+
+        if row is None or time.time() - row[0] > max_age:
+            return None
+        return json.loads(row[1])
+
+    def put(self, key: str, results: list[dict]) -> None:
+        """Store results under key, pruning entries older than the TTL."""
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM cache WHERE ts < ?", (now - SEARCH_CACHE_TTL,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, ts, payload) VALUES (?, ?, ?)",
+                    (key, now, json.dumps(results)),
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug("Search cache write failed: %s", e)
+
+
+_search_cache = _CacheStore(SEARCH_CACHE_PATH)
+
+
+def _search_cache_key(*query) -> str:
+    """Hash the normalized search parameters into a cache key."""
+    return hashlib.sha1(json.dumps(query).encode()).hexdigest()
+
+
+# YouTube's internal (InnerTube) search API, as used by the web client
+INNERTUBE_SEARCH_URL = "https://www.youtube.com/youtubei/v1/search?prettyPrint=false"
+INNERTUBE_CONTEXT = {"client": {"clientName": "WEB", "clientVersion": "2.20240101.00.00", "hl": "en"}}
+INNERTUBE_TIMEOUT = 5  # seconds, per request
+INNERTUBE_TOTAL_TIMEOUT = 6  # seconds, across all pages
+INNERTUBE_MAX_PAGES = 3  # ~20 results per page
+
+# Time limit for the yt-dlp command line search; whatever it found before
+# then is kept. Date-filtered searches need full metadata extraction, so
+# the standalone search gets a generous bound. When raced against
+# youtube-search-python it doesn't need a long one.
+YTDLP_SEARCH_TIMEOUT = 120  # seconds
+YTDLP_RACE_TIMEOUT = 10  # seconds
+
+# In-process YoutubeDL for searches, one per thread since YoutubeDL is not
+# thread-safe. Created on first use, since constructing it is the expensive
+# part. If yt-dlp can't be imported the yt-dlp command line is used instead.
+_search_ydl_local = threading.local()
+_YDL_SEARCH_OPTS = {
+    "quiet": True,
+    "no_warnings": True,
+    "skip_download": True,
+    "ignoreerrors": True,
+    "socket_timeout": 30,
+}
+
+
+def _get_search_ydl():
+    """Return this thread's search YoutubeDL instance, or None if unavailable."""
+    ydl = getattr(_search_ydl_local, "ydl", None)
+    if ydl is None:
+        try:
+            from yt_dlp import YoutubeDL
+        except ImportError:
+            return None
+        ydl = _search_ydl_local.ydl = YoutubeDL(_YDL_SEARCH_OPTS)
+    return ydl
+
+
+def _ytdlp_duration_filter(min_dur: int | None, max_dur: int | None) -> str | None:
+    """Build a yt-dlp --match-filter expression for a duration range in minutes."""
+    clauses = []
+    if min_dur:
+        clauses.append(f"duration >= {min_dur * 60}")
+    if max_dur:
+        clauses.append(f"duration <= {max_dur * 60}")
+    return " & ".join(clauses) or None
+
+
+def _iter_ytdlp_search(
+    ydl,
     keyword: str,
-    num: int = 10,
-    min_duration: int | None = None,
-    max_duration: int | None = None,
-    date_from: str | None = None,
-    date_to: str | None = None,
-) -> list[dict] | None:
-    """Ultra-fast YouTube search using yt-dlp ytsearch (no browser, no extra library).
+    fetch_num: int,
+    min_dur: int | None = None,
+    max_dur: int | None = None,
+) -> Iterator[dict]:
+    """Yield fully extracted ytsearch entries one at a time.
 
-    This is the fastest method (~1.6s vs 11s for full extraction).
-    Uses --flat-playlist to skip full video info extraction.
+    The search is resolved lazily, so the caller can stop iterating once it
+    has enough results and the remaining videos are never extracted.
 
     Args:
+        ydl: YoutubeDL instance
         keyword: Search query
-        num: Number of results to return
-        min_duration: Minimum video duration in minutes
-        max_duration: Maximum video duration in minutes
-        date_from: Filter videos uploaded after this date (YYYYMMDD format)
-        date_to: Filter videos uploaded before this date (YYYYMMDD format)
+        fetch_num: Maximum number of entries to fetch
+        min_dur: Minimum video duration in minutes
+        max_dur: Maximum video duration in minutes
 
-    Returns None if yt-dlp is not available or search fails.
+    Yields:
+        yt-dlp info dicts
     """
-    # Convert to int if passed as string from CLI
-    min_dur = int(min_duration) if min_duration else None
-    max_dur = int(max_duration) if max_duration else None
+    playlist = ydl.extract_info(f"ytsearch{fetch_num}:{keyword}", download=False, process=False)
+    for entry in (playlist or {}).get("entries") or []:
+        if not entry:
+            continue
+
+        # Flat search entries already carry the duration; skip out-of-range
+        # videos before paying for their full extraction
+        duration_sec = entry.get("duration")
+        if duration_sec:
+            if min_dur and duration_sec / 60 < min_dur:
+                continue
+            if max_dur and duration_sec / 60 > max_dur:
+                continue
 
-    # Fetch more results to account for duration/date filtering
-    # With filters, we need more results since many will be filtered out
-    has_filters = min_dur or max_dur or date_from or date_to
-    fetch_num = num * 5 if has_filters else num
-    fetch_num = min(fetch_num, 50)  # yt-dlp reasonable limit
+        # Full extraction (not just the flat entry) so upload_date is available
+        info = ydl.process_ie_result(entry, download=False)
+        if info:
+            yield info
+
+
+def _iter_ytdlp_search_subprocess(
+    keyword: str,
+    fetch_num: int,
+    match_filter: str | None = None,
+    timeout: float = YTDLP_SEARCH_TIMEOUT,
+) -> Iterator[dict]:
+    """Yield ytsearch entries from the yt-dlp command line as they are printed.
+
+    The process is terminated as soon as the caller stops iterating.
 
+    Args:
+        keyword: Search query
+        fetch_num: Number of entries to fetch
+        match_filter: Optional yt-dlp --match-filter expression
+        timeout: Seconds before the process is killed
+
+    Yields:
+        yt-dlp info dicts
+    """
     # Note: --flat-playlist is faster but doesn't return upload_date
     # We need full extraction to get dates, which is slower (~10s vs ~1.5s)
     # but necessary for date filtering and date display
@@ -83,107 +234,214 @@ def _search_ytdlp_fast(
         "--no-warnings",
         "--ignore-errors",
     ]
+    if match_filter:
+        cmd.extend(["--match-filter", match_filter])
     # Note: --dateafter/--datebefore don't work well with ytsearch
     # We do post-filtering by date instead
 
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=120,  # Full extraction needs more time than flat-playlist
+            bufsize=1,
         )
+    except FileNotFoundError:
+        logger.debug("yt-dlp not found")
+        return
 
-        if result.returncode != 0:
-            logger.debug("yt-dlp search failed: %s", result.stderr[:100])
-            return None
+    timed_out = threading.Event()
 
-        # Parse JSON lines output
-        results = []
-        for line in result.stdout.strip().split("\n"):
+    def _kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _kill_on_timeout)
+    timer.start()
+    try:
+        # Parse JSON lines output as it arrives
+        for line in proc.stdout:
+            line = line.strip()
             if not line:
                 continue
             try:
-                v = json.loads(line)
+                yield json.loads(line)
             except json.JSONDecodeError:
                 continue
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+        proc.stdout.close()
+        if timed_out.is_set():
+            logger.warning("yt-dlp search timed out")
 
-            # Extract duration (in seconds from yt-dlp)
-            duration_sec = v.get("duration")
-            if duration_sec:
-                duration_min = duration_sec / 60
-                # Format as MM:SS or HH:MM:SS
-                if duration_sec >= 3600:
-                    duration_str = f"{int(duration_sec // 3600)}:{int((duration_sec % 3600) // 60):02d}:{int(duration_sec % 60):02d}"
-                else:
-                    duration_str = f"{int(duration_sec // 60)}:{int(duration_sec % 60):02d}"
-            else:
-                duration_min = None
-                duration_str = ""
 
-            # Filter by duration if specified
-            if duration_min is not None:
-                if min_dur and duration_min < min_dur:
-                    continue
-                if max_dur and duration_min > max_dur:
-                    continue
-            elif min_dur or max_dur:
-                # Skip videos without duration when filtering
-                continue
+_VIEW_UNITS = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
 
-            # Filter by date if specified (upload_date is YYYYMMDD string)
-            raw_upload_date = v.get("upload_date", "")
-            if date_from or date_to:
-                if not raw_upload_date:
-                    continue  # Skip videos without upload date when filtering
-                if date_from and raw_upload_date < date_from:
-                    continue
-                if date_to and raw_upload_date > date_to:
-                    continue
 
-            video_id = v.get("id", "")
-            url = v.get("url") or f"https://www.youtube.com/watch?v={video_id}"
-
-            # Get view count - yt-dlp returns it as integer
-            view_count = v.get("view_count")
-            if view_count:
-                if view_count >= 1_000_000_000:
-                    views = f"{view_count / 1_000_000_000:.1f}B views"
-                elif view_count >= 1_000_000:
-                    views = f"{view_count / 1_000_000:.1f}M views"
-                elif view_count >= 1_000:
-                    views = f"{view_count / 1_000:.1f}K views"
-                else:
-                    views = f"{view_count} views"
-            else:
-                views = ""
+def _fmt_views(view_count: int) -> str:
+    """Format a view count like YouTube does, e.g. 1234567 -> '1.2M views'."""
+    for divisor, suffix in _VIEW_UNITS:
+        if view_count >= divisor:
+            return f"{view_count / divisor:.1f}{suffix} views"
+    return f"{view_count} views"
 
-            # Format upload date from YYYYMMDD to YYYY-MM-DD
-            upload_date_fmt = ""
-            if raw_upload_date and len(raw_upload_date) == 8:
-                upload_date_fmt = f"{raw_upload_date[:4]}-{raw_upload_date[4:6]}-{raw_upload_date[6:8]}"
 
-            results.append({
-                "url": url,
-                "title": v.get("title", ""),
-                "channel": v.get("channel") or v.get("uploader", ""),
-                "duration": duration_str,
-                "views": views,
-                "date": upload_date_fmt,
-            })
+def _fmt_duration(duration_sec: float) -> str:
+    """Format a duration in seconds as MM:SS or H:MM:SS."""
+    hours, rem = divmod(int(duration_sec), 3600)
+    minutes, seconds = divmod(rem, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
 
-            if len(results) >= num:
-                break
+
+def _ytdlp_entry_to_result(
+    v: dict,
+    min_dur: int | None,
+    max_dur: int | None,
+    date_from: str | None,
+    date_to: str | None,
+) -> dict | None:
+    """Convert a yt-dlp info dict to a search result, applying filters.
+
+    Args:
+        v: yt-dlp info dict for one video
+        min_dur: Minimum video duration in minutes
+        max_dur: Maximum video duration in minutes
+        date_from: Filter videos uploaded after this date (YYYYMMDD format)
+        date_to: Filter videos uploaded before this date (YYYYMMDD format)
+
+    Returns:
+        Result dict, or None if the video is filtered out.
+    """
+    # Extract duration (in seconds from yt-dlp)
+    duration_sec = v.get("duration")
+    if duration_sec:
+        duration_min = duration_sec / 60
+        duration_str = _fmt_duration(duration_sec)
+    else:
+        duration_min = None
+        duration_str = ""
+
+    # Filter by duration if specified
+    if duration_min is not None:
+        if min_dur and duration_min < min_dur:
+            return None
+        if max_dur and duration_min > max_dur:
+            return None
+    elif min_dur or max_dur:
+        # Skip videos without duration when filtering
+        return None
+
+    # Filter by date if specified (upload_date is YYYYMMDD string)
+    raw_upload_date = v.get("upload_date", "")
+    if date_from or date_to:
+        if not raw_upload_date:
+            return None  # Skip videos without upload date when filtering
+        if date_from and raw_upload_date < date_from:
+            return None
+        if date_to and raw_upload_date > date_to:
+            return None
+
+    video_id = v.get("id", "")
+    url = v.get("url") or f"https://www.youtube.com/watch?v={video_id}"
+
+    # Get view count - yt-dlp returns it as integer
+    view_count = v.get("view_count")
+    views = _fmt_views(view_count) if view_count else ""
+
+    # Format upload date from YYYYMMDD to YYYY-MM-DD
+    upload_date_fmt = ""
+    if raw_upload_date and len(raw_upload_date) == 8:
+        upload_date_fmt = f"{raw_upload_date[:4]}-{raw_upload_date[4:6]}-{raw_upload_date[6:8]}"
+
+    return {
+        "url": url,
+        "title": v.get("title", ""),
+        "channel": v.get("channel") or v.get("uploader", ""),
+        "duration": duration_str,
+        "views": views,
+        "date": upload_date_fmt,
+    }
+
+
+def _search_ytdlp_fast(
+    keyword: str,
+    num: int = 10,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    cancel: threading.Event | None = None,
+    timeout: float = YTDLP_SEARCH_TIMEOUT,
+) -> list[dict] | None:
+    """Ultra-fast YouTube search using yt-dlp ytsearch (no browser, no extra library).
+
+    Runs yt-dlp in-process through a per-thread YoutubeDL instance, which
+    avoids a subprocess start and a JSON round-trip per search. Falls back to the
+    yt-dlp command line if the yt_dlp package can't be imported. Either way
+    entries are filtered as they arrive and the search stops once num
+    videos have been accepted.
+
+    Args:
+        keyword: Search query
+        num: Number of results to return
+        min_duration: Minimum video duration in minutes
+        max_duration: Maximum video duration in minutes
+        date_from: Filter videos uploaded after this date (YYYYMMDD format)
+        date_to: Filter videos uploaded before this date (YYYYMMDD format)
+        cancel: Optional event; once set, the search stops and returns None
+        timeout: Time limit in seconds; results found before then are kept
+
+    Returns None if yt-dlp is not available or search fails.
+    """
+    # Convert to int if passed as string from CLI
+    min_dur = int(min_duration) if min_duration else None
+    max_dur = int(max_duration) if max_duration else None
+
+    # Fetch more results to account for duration/date filtering
+    # With filters, we need more results since many will be filtered out
+    has_filters = min_dur or max_dur or date_from or date_to
+    fetch_num = num * 5 if has_filters else num
+    fetch_num = min(fetch_num, 50)  # yt-dlp reasonable limit
+
+    try:
+        ydl = _get_search_ydl()
+        if ydl is not None:
+            entries = _iter_ytdlp_search(ydl, keyword, fetch_num, min_dur, max_dur)
+        else:
+            entries = _iter_ytdlp_search_subprocess(
+                keyword, fetch_num, _ytdlp_duration_filter(min_dur, max_dur), timeout
+            )
+
+        # Results are consumed as they arrive; stopping early skips (or kills)
+        # the extraction of the remaining entries
+        deadline = time.monotonic() + timeout
+        results = []
+        with closing(entries):
+            for v in entries:
+                if cancel is not None and cancel.is_set():
+                    logger.debug("yt-dlp search cancelled")
+                    return None
+                if time.monotonic() > deadline:
+                    logger.warning("yt-dlp search timed out")
+                    break
+                result = _ytdlp_entry_to_result(v, min_dur, max_dur, date_from, date_to)
+                if result is None:
+                    continue
+
+                results.append(result)
+                if len(results) >= num:
+                    break
 
         logger.info("yt-dlp fast search found %d videos", len(results))
         return results if results else None
 
-    except subprocess.TimeoutExpired:
-        logger.warning("yt-dlp search timed out")
-        return None
-    except FileNotFoundError:
-        logger.debug("yt-dlp not found")
-        return None
     except Exception as e:
         logger.warning("yt-dlp search failed: %s", e)
         return None
@@ -218,19 +476,23 @@ def _search_youtube_fast(
         search = VideosSearch(keyword, limit=min(fetch_num, 50))  # API limit is 50
         raw_results = search.result().get("result", [])
 
+        # Duration filter bounds in seconds, computed once
+        min_sec = int(min_duration) * 60 if min_duration else None
+        max_sec = int(max_duration) * 60 if max_duration else None
+
         results = []
         for v in raw_results:
             # Parse duration
             duration_str = v.get("duration", "")
-            duration_min = parse_duration_to_minutes(duration_str)
+            duration_sec = _duration_to_seconds(duration_str)
 
             # Filter by duration if specified
-            if duration_min is not None:
-                if min_duration and duration_min < min_duration:
+            if duration_sec is not None:
+                if min_sec and duration_sec < min_sec:
                     continue
-                if max_duration and duration_min > max_duration:
+                if max_sec and duration_sec > max_sec:
                     continue
-            elif min_duration or max_duration:
+            elif min_sec or max_sec:
                 # Skip videos without duration when filtering
                 continue
 
@@ -257,29 +519,249 @@ def _search_youtube_fast(
         return None
 
 
-def parse_duration_to_minutes(duration_str: str) -> float | None:
-    """Parse duration string like '3:45' or '1:23:45' to minutes."""
-    if not duration_str:
+def _search_sp_param(
+    upload_date: str | None = None,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+) -> str | None:
+    """Return the URL-encoded YouTube `sp` search filter, if one applies.
+
+    An upload date filter takes priority over duration filters, since
+    YouTube can't easily combine them. The duration buckets are:
+    short (< 4 min), medium (4-20 min) and long (> 20 min).
+    """
+    if upload_date and upload_date in UPLOAD_DATE_PARAMS:
+        return UPLOAD_DATE_PARAMS[upload_date]
+
+    min_dur = int(min_duration) if min_duration else None
+    max_dur = int(max_duration) if max_duration else None
+    if min_dur and max_dur:
+        if min_dur >= 4 and max_dur <= 20:
+            return "EgIYAw%3D%3D"  # Medium (4-20 min)
+        if max_dur <= 4:
+            return "EgIYAQ%3D%3D"  # Short (< 4 min)
+        if min_dur >= 20:
+            return "EgIYAg%3D%3D"  # Long (> 20 min)
+    return None
+
+
+def _innertube_post(body: dict, timeout: float = INNERTUBE_TIMEOUT) -> dict:
+    """POST a request body to the InnerTube search endpoint."""
+    request = urllib.request.Request(
+        INNERTUBE_SEARCH_URL,
+        data=json.dumps({"context": INNERTUBE_CONTEXT, **body}).encode(),
+        headers={"Content-Type": "application/json", "Accept-Encoding": "gzip"},
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        data = resp.read()
+        if resp.headers.get("Content-Encoding") == "gzip":
+            data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def _innertube_text(obj: dict | None) -> str:
+    """Return the text of an InnerTube text object ({simpleText} or {runs})."""
+    if not obj:
+        return ""
+    if "simpleText" in obj:
+        return obj["simpleText"]
+    return "".join(run.get("text", "") for run in obj.get("runs", []))
+
+
+def _search_innertube(
+    keyword: str,
+    num: int = 10,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    upload_date: str | None = None,
+) -> list[dict] | None:
+    """Search via YouTube's InnerTube JSON API with a plain HTTPS request.
+
+    A single round trip per page of ~20 results, with no browser and no
+    third-party dependency. Paging stops after INNERTUBE_TOTAL_TIMEOUT.
+    InnerTube only reports relative upload times ("2 days ago"), so custom
+    date ranges are left to the other tiers.
+
+    Returns the matching videos found, which may be fewer than `num`, or
+    None if a date range is given or nothing was found.
+    """
+    if date_from or date_to:
         return None
 
-    duration_str = duration_str.strip()
-    parts = duration_str.split(":")
+    min_sec = int(min_duration) * 60 if min_duration else None
+    max_sec = int(max_duration) * 60 if max_duration else None
 
+    body = {"query": keyword}
+    sp = _search_sp_param(upload_date, min_duration, max_duration)
+    if sp:
+        body["params"] = urllib.parse.unquote(sp)
+
+    deadline = time.monotonic() + INNERTUBE_TOTAL_TIMEOUT
+    results = []
     try:
-        if len(parts) == 2:  # MM:SS
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-            return minutes + seconds / 60
-        elif len(parts) == 3:  # HH:MM:SS
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = int(parts[2])
-            return hours * 60 + minutes + seconds / 60
-        else:
-            return None
-    except (ValueError, IndexError):
+        data = _innertube_post(body)
+        sections = (
+            data["contents"]["twoColumnSearchResultsRenderer"]["primaryContents"]
+            ["sectionListRenderer"]["contents"]
+        )
+        for _ in range(INNERTUBE_MAX_PAGES):
+            token = None
+            for section in sections:
+                if "continuationItemRenderer" in section:
+                    token = (
+                        section["continuationItemRenderer"]["continuationEndpoint"]
+                        ["continuationCommand"]["token"]
+                    )
+                    continue
+                for item in section.get("itemSectionRenderer", {}).get("contents", []):
+                    v = item.get("videoRenderer")
+                    if not v or len(results) >= num:
+                        continue
+
+                    duration_str = _innertube_text(v.get("lengthText"))
+                    duration_sec = _duration_to_seconds(duration_str)
+                    if duration_sec is not None:
+                        if min_sec and duration_sec < min_sec:
+                            continue
+                        if max_sec and duration_sec > max_sec:
+                            continue
+                    elif min_sec or max_sec:
+                        continue  # Skip videos without duration when filtering
+
+                    results.append({
+                        "url": f"https://www.youtube.com/watch?v={v['videoId']}",
+                        "title": _innertube_text(v.get("title")),
+                        "channel": _innertube_text(v.get("ownerText")),
+                        "duration": duration_str,
+                        "views": _innertube_text(v.get("shortViewCountText") or v.get("viewCountText")),
+                        "date": _innertube_text(v.get("publishedTimeText")),
+                    })
+
+            remaining = deadline - time.monotonic()
+            if len(results) >= num or not token or remaining <= 0:
+                break
+            data = _innertube_post({"continuation": token}, timeout=min(INNERTUBE_TIMEOUT, remaining))
+            sections = (
+                data["onResponseReceivedCommands"][0]["appendContinuationItemsAction"]
+                ["continuationItems"]
+            )
+    except Exception as e:
+        # Keep the pages fetched before the failure
+        logger.debug("InnerTube search failed: %s", e)
+
+    if not results:
         return None
 
+    logger.info("InnerTube search found %d videos", len(results))
+    return results
+
+
+def _search_browserless(
+    keyword: str,
+    num: int = 10,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+    upload_date: str | None = None,
+) -> list[dict] | None:
+    """Search without a browser: InnerTube first, topped up by the race.
+
+    If InnerTube returns fewer than `num` videos, the yt-dlp /
+    youtube-search-python race runs and its results are appended, skipping
+    videos already found.
+
+    Returns None if no tier found anything.
+    """
+    filters = {
+        "num": num,
+        "min_duration": min_duration,
+        "max_duration": max_duration,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    results = _search_innertube(keyword, upload_date=upload_date, **filters) or []
+    if len(results) < num:
+        seen = {r["url"] for r in results}
+        for r in _search_fast_race(keyword, **filters) or []:
+            if r["url"] not in seen and len(results) < num:
+                seen.add(r["url"])
+                results.append(r)
+    return results or None
+
+
+def _search_fast_race(
+    keyword: str,
+    num: int = 10,
+    min_duration: int | None = None,
+    max_duration: int | None = None,
+    date_from: str | None = None,
+    date_to: str | None = None,
+) -> list[dict] | None:
+    """Run the two browserless search tiers concurrently.
+
+    yt-dlp and youtube-search-python are independent, so instead of waiting
+    for one to fail before starting the other, both start at once and the
+    first non-empty result wins. The yt-dlp search is then told to stop.
+
+    youtube-search-python can't filter by date, so with a date range there
+    is no race: yt-dlp runs alone and youtube-search-python is only tried
+    if it finds nothing.
+
+    Returns None if neither tier found anything.
+    """
+    filters = {
+        "num": num,
+        "min_duration": min_duration,
+        "max_duration": max_duration,
+        "date_from": date_from,
+        "date_to": date_to,
+    }
+    if date_from or date_to:
+        return _search_ytdlp_fast(keyword, **filters) or _search_youtube_fast(keyword, **filters)
+
+    cancel = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=2)
+    futures = [
+        executor.submit(
+            _search_ytdlp_fast, keyword, cancel=cancel, timeout=YTDLP_RACE_TIMEOUT, **filters
+        ),
+        executor.submit(_search_youtube_fast, keyword, **filters),
+    ]
+    try:
+        for future in as_completed(futures):
+            results = future.result()
+            if results:
+                return results
+        return None
+    finally:
+        cancel.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _duration_to_seconds(duration_str: str) -> int | None:
+    """Parse duration string like '3:45' or '1:23:45' to whole seconds."""
+    if not duration_str:
+        return None
+
+    parts = duration_str.strip().split(":")
+    try:
+        if len(parts) == 2:  # MM:SS
+            return int(parts[0]) * 60 + int(parts[1])
+        if len(parts) == 3:  # HH:MM:SS
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+    except ValueError:
+        pass
+    return None
+
+
+def parse_duration_to_minutes(duration_str: str) -> float | None:
+    """Parse duration string like '3:45' or '1:23:45' to minutes."""
+    seconds = _duration_to_seconds(duration_str)
+    return seconds / 60 if seconds is not None else None
+
 
 # Quality options for video download
 QualityOption = Literal["best", "1080p", "720p", "480p", "360p", "audio"]
@@ -296,6 +778,9 @@ UPLOAD_DATE_PARAMS = {
     "year": "EgIIBQ%3D%3D",
 }
 
+# Per-video download time limit (the download is aborted after this)
+DOWNLOAD_TIMEOUT = 600  # seconds
+
 # Format strings for yt-dlp - prefer mp4/m4a over webm for compatibility
 QUALITY_FORMATS = {
     "best": "bestvideo[ext=mp4]+bestaudio[ext=m4a]/bestvideo+bestaudio/best",
@@ -306,7 +791,218 @@ QUALITY_FORMATS = {
     "audio": "bestaudio[ext=m4a]/bestaudio/best",
 }
 
+# yt-dlp options shared by every download, built once
+_BASE_DL_CMD = [
+    "yt-dlp",
+    "--no-playlist",            # Don't download playlists
+    # Note: no --restrict-filenames, to preserve Unicode in filenames
+    # Speed optimizations. Use the native downloader with high concurrent
+    # fragments (-N, best for YouTube DASH); aria2c is slower for DASH
+    # streams that need merging
+    "--buffer-size", "64K",     # Larger buffer for better throughput
+    "--http-chunk-size", "10M", # Larger chunks reduce overhead
+    "--no-check-certificates",  # Skip cert verification (faster)
+    "--no-mtime",               # Don't set mtime (faster)
+]
+
+# Format selection per quality option
+_QUALITY_CMD = {
+    quality: ["-f", format_str, "--merge-output-format", "mp4"]
+    for quality, format_str in QUALITY_FORMATS.items()
+}
+_AUDIO_ONLY_CMD = ["-f", "bestaudio/best", "-x", "--audio-format", "mp3"]
+
+_ARIA2C_CMD = ["--external-downloader", "aria2c", "--external-downloader-args", f"aria2c:{ARIA2C_ARGS}"]
+
+
+class _PlaywrightSession:
+    """Process-wide browser for the Playwright search fallback.
+
+    Launching Chromium costs 1-2s, so the browser and context are kept
+    alive between searches and each search gets a fresh page. A browser
+    left idle for longer than IDLE_TIMEOUT is closed and relaunched on next
+    use. That check runs on access rather than from a timer thread, because
+    Playwright sync objects may only be used from the thread that created
+    them.
+    """
+
+    IDLE_TIMEOUT: ClassVar[float] = 60.0  # seconds
+
+    _p: ClassVar = None
+    _browser: ClassVar = None
+    _context: ClassVar = None
+    _headless: ClassVar[bool | None] = None
+    _last_used: ClassVar[float] = 0.0
+
+    @classmethod
+    def get_page(cls, headless: bool = True) -> Page:
+        """Return a new page, launching the browser if needed.
+
+        Args:
+            headless: Run browser in headless mode.
+
+        Returns:
+            Playwright page in the shared context.
+        """
+        idle = time.monotonic() - cls._last_used > cls.IDLE_TIMEOUT
+        if cls._context is not None and (
+            idle or headless != cls._headless or not cls._browser.is_connected()
+        ):
+            cls.shutdown()
+
+        if cls._context is None:
+            if cls._p is None:
+                cls._p = sync_playwright().start()
+            cls._browser = cls._p.chromium.launch(
+                headless=headless,
+                args=["--start-maximized"] if not headless else [],
+            )
+            cls._context = cls._browser.new_context(no_viewport=True) if not headless else cls._browser.new_context(viewport={"width": 1920, "height": 1080})
+            cls._headless = headless
+
+        cls._last_used = time.monotonic()
+        return cls._context.new_page()
+
+    @classmethod
+    def release_page(cls, page: Page) -> None:
+        """Close a page obtained from get_page() and keep the browser alive."""
+        cls._last_used = time.monotonic()
+        try:
+            page.close()
+        except Exception:
+            pass
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close the browser and stop Playwright."""
+        for closeable in (cls._context, cls._browser):
+            if closeable is not None:
+                try:
+                    closeable.close()
+                except Exception:
+                    pass
+        cls._context = None
+        cls._browser = None
+        cls._headless = None
+        if cls._p is not None:
+            try:
+                cls._p.stop()
+            except Exception:
+                pass
+            cls._p = None
+
+
+atexit.register(_PlaywrightSession.shutdown)
+
+
+# 11-character YouTube video ID in a watch URL
+_VID_ID_RE = re.compile(r"[?&]v=([A-Za-z0-9_-]{11})")
+
+# Extracts search result cards in one pass: a single selector finds every title
+# link, non-video links are dropped by href before any further DOM work, and
+# only the surviving cards are queried for channel, duration and metadata.
+# Results only grow as the page scrolls, so links before `start` were already
+# extracted by an earlier call and are skipped; `total` is the next start.
+_YT_EXTRACT_VIDEOS_JS = """
+(start) => {
+    const videos = [];
+    const titleLinks = document.querySelectorAll('ytd-video-renderer a#video-title');
+    for (const titleLink of Array.prototype.slice.call(titleLinks, start)) {
+        const href = titleLink.getAttribute('href');
+        if (!href || !href.includes('/watch?v=')) continue;
+
+        const elem = titleLink.closest('ytd-video-renderer');
+        const title = titleLink.getAttribute('title') || titleLink.textContent;
+        const channelElem = elem.querySelector('ytd-channel-name a');
+        const durationElem = elem.querySelector('span.ytd-thumbnail-overlay-time-status-renderer');
+        const metadataSpans = elem.querySelectorAll('#metadata-line span');
+
+        // Date is usually the second span in metadata-line (e.g., "2 days ago")
+        const date = metadataSpans.length > 1 ? metadataSpans[1].textContent.trim() : '';
+
+        videos.push({
+            href: href,
+            title: title ? title.trim() : '',
+            channel: channelElem ? channelElem.textContent.trim() : '',
+            duration: durationElem ? durationElem.textContent.trim() : '',
+            views: metadataSpans.length > 0 ? metadataSpans[0].textContent.trim() : '',
+            date: date
+        });
+    }
+    return { total: titleLinks.length, videos };
+}
+"""
+
+# True once more result cards are rendered than the given count
+_YT_MORE_CARDS_JS = "(n) => document.querySelectorAll('ytd-video-renderer a#video-title').length > n"
+
+
+def _cli_arg_type(hint):
+    """Resolve a field's type hint for argparse, unwrapping `X | None`."""
+    if typing.get_origin(hint) in (typing.Union, types.UnionType):
+        args = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return hint
+
+
+def _cli_command(cls):
+    """Class decorator: precompute a dataclass command's CLI spec once.
 
+    Stores on the class:
+        _argspec: (names, kwargs) pairs for parser.add_argument
+        _field_names: public field names, for from_args
+
+    Field types are resolved once with typing.get_type_hints, so `int | None`
+    fields are parsed as int too.
+    """
+    hints = typing.get_type_hints(cls)
+    argspec = []
+    for fld in dataclasses.fields(cls):
+        name = fld.name
+        if name.startswith("_"):
+            continue
+
+        help_text = cls._cli_help.get(name, "")
+        is_required = fld.default is dataclasses.MISSING
+        default = fld.default if not is_required else None
+        short = cls._cli_short.get(name)
+        arg_type = _cli_arg_type(hints[name])
+
+        if is_required:
+            names = [name]
+        else:
+            names = [f"--{name}"]
+            if short:
+                names.insert(0, f"-{short}")
+
+        kwargs = {"help": help_text}
+
+        if not is_required:
+            kwargs["default"] = default
+
+        if name in cls._cli_choices:
+            kwargs["choices"] = cls._cli_choices[name]
+
+        if arg_type is bool:
+            if default is True:
+                names = [f"--no-{name}"]
+                kwargs["action"] = "store_false"
+                kwargs["dest"] = name
+                kwargs.pop("default", None)
+            else:
+                kwargs["action"] = "store_true"
+        elif arg_type is int:
+            kwargs["type"] = int
+
+        argspec.append((tuple(names), kwargs))
+
+    cls._argspec = argspec
+    cls._field_names = tuple(fld.name for fld in dataclasses.fields(cls) if not fld.name.startswith("_"))
+    return cls
+
+
+@_cli_command
 @dataclass
 class YouTubeSearch:
     """YouTube video search automation.
@@ -335,6 +1031,8 @@ class YouTubeSearch:
         "upload_date": "Filter by upload date (hour, today, week, month, year)",
         "date_from": "Custom date range start (YYYYMMDD format, e.g., 20240101)",
         "date_to": "Custom date range end (YYYYMMDD format, e.g., 20241231)",
+        "cache": "Don't read or write the search result cache",
+        "refresh": "Ignore cached results and re-run the search",
     }
     _cli_choices: ClassVar[dict] = {
         "upload_date": ["hour", "today", "week", "month", "year"],
@@ -361,6 +1059,8 @@ class YouTubeSearch:
     upload_date: str | None = None
     date_from: str | None = None  # YYYYMMDD format
     date_to: str | None = None    # YYYYMMDD format
+    cache: bool = True
+    refresh: bool = False
 
     def execute(self, page: Page) -> list[dict]:
         """Execute the YouTube search on the given page.
@@ -375,28 +1075,11 @@ class YouTubeSearch:
         encoded_keyword = urllib.parse.quote(self.keyword)
         search_url = f"https://www.youtube.com/results?search_query={encoded_keyword}"
 
-        # Add upload date filter via URL parameter (sp parameter)
-        # These take priority over duration filters (can't easily combine in YouTube)
-        if self.upload_date and self.upload_date in UPLOAD_DATE_PARAMS:
-            search_url += f"&sp={UPLOAD_DATE_PARAMS[self.upload_date]}"
-            logger.info("Using YouTube URL filter: upload date = %s", self.upload_date)
-        else:
-            # Add duration filter via URL parameter (sp parameter)
-            # Short (< 4 min): EgIYAQ%3D%3D
-            # Medium (4-20 min): EgIYAw%3D%3D
-            # Long (> 20 min): EgIYAg%3D%3D
-            min_dur = int(self.min_duration) if self.min_duration else None
-            max_dur = int(self.max_duration) if self.max_duration else None
-            if min_dur and max_dur:
-                if min_dur >= 4 and max_dur <= 20:
-                    search_url += "&sp=EgIYAw%3D%3D"  # Medium (4-20 min)
-                    logger.info("Using YouTube URL filter: 4-20 minutes")
-                elif max_dur <= 4:
-                    search_url += "&sp=EgIYAQ%3D%3D"  # Short (< 4 min)
-                    logger.info("Using YouTube URL filter: < 4 minutes")
-                elif min_dur >= 20:
-                    search_url += "&sp=EgIYAg%3D%3D"  # Long (> 20 min)
-                    logger.info("Using YouTube URL filter: > 20 minutes")
+        # Add upload date or duration filter via URL parameter (sp parameter)
+        sp = _search_sp_param(self.upload_date, self.min_duration, self.max_duration)
+        if sp:
+            search_url += f"&sp={sp}"
+            logger.info("Using YouTube URL filter: sp=%s", sp)
 
         logger.info("Searching YouTube: '%s'", self.keyword)
         page.goto(search_url)
@@ -428,36 +1111,39 @@ class YouTubeSearch:
     def _extract_videos_with_scroll(self, page: Page) -> list[dict]:
         """Extract videos, scrolling as needed to find enough matching results."""
         results = []
-        seen_urls = set()
+        seen_ids = set()
         max_scrolls = 20  # Increase scrolls since we filter by duration
+        max_stale_scrolls = 2  # Stop once scrolling stops loading new cards
         scroll_count = 0
+        stale_count = 0
+        last_seen_count = 0  # Cards already extracted by previous passes
 
-        # Convert duration filters to int
-        min_dur = int(self.min_duration) if self.min_duration else None
-        max_dur = int(self.max_duration) if self.max_duration else None
+        # Duration filter bounds in seconds, computed once
+        min_sec = int(self.min_duration) * 60 if self.min_duration else None
+        max_sec = int(self.max_duration) * 60 if self.max_duration else None
 
         while len(results) < self.num and scroll_count < max_scrolls:
             # Extract from current view
-            new_results = self._extract_videos(page, seen_urls)
+            new_results, last_seen_count = self._extract_videos(page, seen_ids, last_seen_count)
 
             # Filter by duration if specified
             for video in new_results:
-                duration_min = parse_duration_to_minutes(video.get("duration", ""))
-                if duration_min is None:
+                duration_sec = _duration_to_seconds(video.get("duration", ""))
+                if duration_sec is None:
                     continue  # Skip videos without duration
 
                 # Check min duration
-                if min_dur and duration_min < min_dur:
-                    logger.debug("  Skipped (too short: %.1f min): %s", duration_min, video["title"][:40])
+                if min_sec and duration_sec < min_sec:
+                    logger.debug("  Skipped (too short: %.1f min): %s", duration_sec / 60, video["title"][:40])
                     continue
 
                 # Check max duration
-                if max_dur and duration_min > max_dur:
-                    logger.debug("  Skipped (too long: %.1f min): %s", duration_min, video["title"][:40])
+                if max_sec and duration_sec > max_sec:
+                    logger.debug("  Skipped (too long: %.1f min): %s", duration_sec / 60, video["title"][:40])
                     continue
 
                 results.append(video)
-                logger.info("  [%d/%d] %.1f min: %s", len(results), self.num, duration_min, video["title"][:50])
+                logger.info("  [%d/%d] %.1f min: %s", len(results), self.num, duration_sec / 60, video["title"][:50])
 
                 if len(results) >= self.num:
                     break
@@ -465,60 +1151,60 @@ class YouTubeSearch:
             if len(results) >= self.num:
                 break
 
-            # Scroll for more
-            page.evaluate("window.scrollBy(0, window.innerHeight)")
-            time.sleep(0.3)
+            # Scroll to the bottom, where the continuation spinner triggers
+            # loading the next batch, and wait for new cards to render
+            page.evaluate("window.scrollTo(0, document.documentElement.scrollHeight)")
             scroll_count += 1
+            try:
+                page.wait_for_function(
+                    _YT_MORE_CARDS_JS, arg=last_seen_count, timeout=2000
+                )
+                stale_count = 0
+            except Exception:
+                stale_count += 1
+                if stale_count >= max_stale_scrolls:
+                    logger.debug("No new results after %d scrolls, stopping", stale_count)
+                    break
 
         return results[:self.num]
 
-    def _extract_videos(self, page: Page, seen_urls: set | None = None) -> list[dict]:
-        """Extract video information from search results using fast JS evaluation."""
-        if seen_urls is None:
-            seen_urls = set()
-
-        # Extract all video data in one JS call (much faster than multiple Playwright calls)
-        videos_data = page.evaluate("""
-            () => {
-                const videos = [];
-                document.querySelectorAll('ytd-video-renderer').forEach(elem => {
-                    const titleLink = elem.querySelector('a#video-title');
-                    if (!titleLink) return;
-
-                    const href = titleLink.getAttribute('href');
-                    const title = titleLink.getAttribute('title') || titleLink.textContent;
-
-                    if (!href || !href.includes('/watch?v=')) return;
-
-                    const channelElem = elem.querySelector('ytd-channel-name a');
-                    const durationElem = elem.querySelector('span.ytd-thumbnail-overlay-time-status-renderer');
-                    const metadataSpans = elem.querySelectorAll('#metadata-line span');
-
-                    // Date is usually the second span in metadata-line (e.g., "2 days ago")
-                    const date = metadataSpans.length > 1 ? metadataSpans[1].textContent.trim() : '';
-
-                    videos.push({
-                        href: href,
-                        title: title ? title.trim() : '',
-                        channel: channelElem ? channelElem.textContent.trim() : '',
-                        duration: durationElem ? durationElem.textContent.trim() : '',
-                        views: metadataSpans.length > 0 ? metadataSpans[0].textContent.trim() : '',
-                        date: date
-                    });
-                });
-                return videos;
-            }
-        """)
-
-        logger.info("Found %d video elements", len(videos_data))
+    def _extract_videos(
+        self, page: Page, seen_ids: set | None = None, start: int = 0
+    ) -> tuple[list[dict], int]:
+        """Extract video information from search results using fast JS evaluation.
+
+        Args:
+            page: Playwright page with search results loaded.
+            seen_ids: Video IDs already returned, updated in place.
+            start: Number of result cards already extracted; only cards
+                after it are read.
+
+        Returns:
+            Tuple of (new video dicts, total result cards on the page).
+        """
+        if seen_ids is None:
+            seen_ids = set()
+
+        # Extract all new video data in one JS call (much faster than multiple Playwright calls)
+        extracted = page.evaluate(_YT_EXTRACT_VIDEOS_JS, start)
+        videos_data = extracted["videos"]
+
+        logger.info("Found %d new video elements", len(videos_data))
 
         results = []
         for v in videos_data:
             href = v.get("href", "")
-            if not href or href in seen_urls:
+            if not href:
+                continue
+
+            # Dedupe on the video ID; the same video can come back with
+            # different query-string extras (&pp=, &list=, &t=)
+            match = _VID_ID_RE.search(href)
+            video_id = match.group(1) if match else href
+            if video_id in seen_ids:
                 continue
 
-            seen_urls.add(href)
+            seen_ids.add(video_id)
             url = f"https://www.youtube.com{href}" if href.startswith("/") else href
 
             results.append({
@@ -530,15 +1216,44 @@ class YouTubeSearch:
                 "date": v.get("date", ""),
             })
 
-        return results
+        return results, extracted["total"]
 
     def run(self) -> list[dict]:
-        """Run the complete search with browser management.
+        """Run the complete search, reusing cached results when available.
+
+        Results are cached on disk for SEARCH_CACHE_TTL seconds, keyed by
+        the search parameters. --no-cache bypasses the cache entirely and
+        --refresh re-runs the search and overwrites the cached entry.
+        """
+        cache_key = _search_cache_key(
+            self.keyword, self.num, self.min_duration, self.max_duration,
+            self.upload_date, self.date_from, self.date_to,
+        )
+        if self.cache and not self.refresh:
+            results = _search_cache.get(cache_key)
+            if results:
+                logger.info("Using cached results for: '%s'", self.keyword)
+                self._save_results(results)
+                return results
+
+        results = self._search()
+        if results and self.cache:
+            _search_cache.put(cache_key, results)
+        return results
+
+    def _search(self) -> list[dict]:
+        """Search with browser management, without the result cache.
 
-        Uses a 3-tier fallback strategy:
-        1. yt-dlp ytsearch (fastest, ~1.5s, no browser)
+        Uses a 4-tier fallback strategy:
+        0. InnerTube JSON API (fastest, one HTTPS request, no browser)
+        1. yt-dlp ytsearch (fast, ~1.5s, no browser)
         2. youtube-search-python (fast, ~2-3s, no browser)
         3. Playwright browser (slowest, ~6-10s, most reliable)
+
+        Tiers 1 and 2 only run if tier 0 found fewer than `num` videos, and
+        their results top up tier 0's. They run concurrently and the first to
+        return results wins (except with a date range, where tier 2 is only a
+        fallback); the browser is only started if every tier comes back empty.
         """
         date_info = ""
         if self.date_from or self.date_to:
@@ -547,27 +1262,15 @@ class YouTubeSearch:
                     self.keyword, self.num,
                     self.min_duration or "any", self.max_duration or "any", date_info)
 
-        # Try fastest method first: yt-dlp ytsearch
-        results = _search_ytdlp_fast(
-            self.keyword,
-            num=self.num,
-            min_duration=self.min_duration,
-            max_duration=self.max_duration,
-            date_from=self.date_from,
-            date_to=self.date_to,
-        )
-        if results:
-            self._save_results(results)
-            return results
-
-        # Fallback to youtube-search-python
-        results = _search_youtube_fast(
+        # Tier 0: InnerTube API, topped up by racing yt-dlp and youtube-search-python
+        results = _search_browserless(
             self.keyword,
             num=self.num,
             min_duration=self.min_duration,
             max_duration=self.max_duration,
             date_from=self.date_from,
             date_to=self.date_to,
+            upload_date=self.upload_date,
         )
         if results:
             self._save_results(results)
@@ -575,21 +1278,13 @@ class YouTubeSearch:
 
         # Final fallback: Playwright browser
         logger.info("Fast search unavailable, using Playwright browser")
-        with sync_playwright() as p:
-            browser = p.chromium.launch(
-                headless=self.headless,
-                args=["--start-maximized"] if not self.headless else [],
-            )
-            context = browser.new_context(no_viewport=True) if not self.headless else browser.new_context(viewport={"width": 1920, "height": 1080})
-            page = context.new_page()
-
-            try:
-                results = self.execute(page)
-                logger.info("Found %d videos", len(results))
-                return results
-            finally:
-                context.close()
-                browser.close()
+        page = _PlaywrightSession.get_page(self.headless)
+        try:
+            results = self.execute(page)
+            logger.info("Found %d videos", len(results))
+            return results
+        finally:
+            _PlaywrightSession.release_page(page)
 
     def _save_results(self, results: list[dict]) -> None:
         """Save results to output file if specified."""
@@ -612,57 +1307,16 @@ class YouTubeSearch:
     def add_to_parser(cls, subparsers) -> None:
         """Add this command to argparse subparsers."""
         parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
-
-        for name, fld in cls.__dataclass_fields__.items():
-            if name.startswith("_"):
-                continue
-
-            help_text = cls._cli_help.get(name, "")
-            is_required = fld.default is dataclasses.MISSING
-            default = fld.default if not is_required else None
-            short = cls._cli_short.get(name)
-
-            if is_required:
-                names = [name]
-            else:
-                names = [f"--{name}"]
-                if short:
-                    names.insert(0, f"-{short}")
-
-            kwargs = {"help": help_text}
-
-            if not is_required:
-                kwargs["default"] = default
-
-            if name in cls._cli_choices:
-                kwargs["choices"] = cls._cli_choices[name]
-
-            if fld.type is bool or (hasattr(fld, 'type') and fld.type is bool):
-                if default is True:
-                    names = [f"--no-{name}"]
-                    kwargs["action"] = "store_false"
-                    kwargs["dest"] = name
-                    kwargs.pop("default", None)
-                else:
-                    kwargs["action"] = "store_true"
-
-            if fld.type is int:
-                kwargs["type"] = int
-
+        for names, kwargs in cls._argspec:
             parser.add_argument(*names, **kwargs)
 
     @classmethod
     def from_args(cls, args) -> "YouTubeSearch":
         """Create instance from parsed args."""
-        kwargs = {}
-        for name in cls.__dataclass_fields__:
-            if name.startswith("_"):
-                continue
-            if hasattr(args, name):
-                kwargs[name] = getattr(args, name)
-        return cls(**kwargs)
+        return cls(**{name: getattr(args, name) for name in cls._field_names if hasattr(args, name)})
 
 
+@_cli_command
 @dataclass
 class YouTubeDownload:
     """YouTube video download using yt-dlp.
@@ -696,6 +1350,8 @@ class YouTubeDownload:
         "concurrent_fragments": "Concurrent fragment downloads per video (default: 4)",
         "date_from": "Custom date range start (YYYYMMDD format, e.g., 20240101)",
         "date_to": "Custom date range end (YYYYMMDD format, e.g., 20241231)",
+        "cache": "Don't read or write the search result cache (with --search)",
+        "refresh": "Ignore cached search results (with --search)",
     }
     _cli_choices: ClassVar[dict] = {
         "quality": ["best", "1080p", "720p", "480p", "360p", "audio"],
@@ -728,6 +1384,8 @@ class YouTubeDownload:
     concurrent_fragments: int = 8  # Higher = faster for DASH/HLS streams
     date_from: str | None = None  # YYYYMMDD format
     date_to: str | None = None    # YYYYMMDD format
+    cache: bool = True
+    refresh: bool = False
 
     def run(self) -> list[str]:
         """Run the download and return list of downloaded files."""
@@ -740,19 +1398,21 @@ class YouTubeDownload:
         if self.search:
             logger.info("Searching for: %s", self.url)
 
-            # Try fastest method first: yt-dlp ytsearch (no browser needed)
-            results = _search_ytdlp_fast(
-                self.url,
-                num=self.num,
-                min_duration=self.min_duration,
-                max_duration=self.max_duration,
-                date_from=self.date_from,
-                date_to=self.date_to,
+            cache_key = _search_cache_key(
+                self.url, self.num, self.min_duration, self.max_duration,
+                None, self.date_from, self.date_to,
             )
-
-            # Fallback to youtube-search-python
+            results = None
+            if self.cache and not self.refresh:
+                results = _search_cache.get(cache_key)
+                if results:
+                    logger.info("Using cached search results")
+            from_cache = bool(results)
+
+            # Browserless tiers: InnerTube API, topped up by racing yt-dlp
+            # ytsearch and youtube-search-python
             if not results:
-                results = _search_youtube_fast(
+                results = _search_browserless(
                     self.url,
                     num=self.num,
                     min_duration=self.min_duration,
@@ -761,7 +1421,8 @@ class YouTubeDownload:
                     date_to=self.date_to,
                 )
 
-            # Final fallback to Playwright browser
+            # Final fallback to Playwright browser. Runs the browser search
+            # directly; YouTubeSearch.run() would repeat the tiers above
             if not results:
                 logger.info("Fast search unavailable, using Playwright browser")
                 searcher = YouTubeSearch(
@@ -772,177 +1433,235 @@ class YouTubeDownload:
                     max_duration=self.max_duration,
                     date_from=self.date_from,
                     date_to=self.date_to,
+                    cache=False,
                 )
-                results = searcher.run()
+                page = _PlaywrightSession.get_page(self.headless)
+                try:
+                    results = searcher.execute(page)
+                finally:
+                    _PlaywrightSession.release_page(page)
 
             if not results:
                 logger.warning("No videos found for search query")
                 return []
 
+            if self.cache and not from_cache:
+                _search_cache.put(cache_key, results)
+
             urls_to_download = [r["url"] for r in results[:self.num]]
             logger.info("Downloading %d video(s) with %d parallel workers...", len(urls_to_download), self.parallel)
         else:
             urls_to_download = [self.url]
 
-        downloaded_files = []
-
-        # Use parallel downloads for multiple videos
-        if len(urls_to_download) > 1 and self.parallel > 1:
-            with ThreadPoolExecutor(max_workers=self.parallel) as executor:
-                futures = {
-                    executor.submit(self._download_single, url, output_path): url
-                    for url in urls_to_download
-                }
-                for future in as_completed(futures):
-                    result = future.result()
-                    if result:
-                        downloaded_files.append(result)
-        else:
-            # Single download or parallel=1
-            for url in urls_to_download:
-                result = self._download_single(url, output_path)
-                if result:
-                    downloaded_files.append(result)
+        # Prefer yt-dlp in-process: no interpreter startup per run
+        downloaded_files = self._download_in_process(urls_to_download, output_path)
+        if downloaded_files is None:
+            # Fallback: the yt-dlp command line. One process per batch instead
+            # of one per video; batches run in parallel, so at most `parallel`
+            # processes are started
+            workers = min(max(1, self.parallel), len(urls_to_download))
+            batches = [urls_to_download[i::workers] for i in range(workers)]
+            downloaded_files = asyncio.run(self._run_downloads(batches, output_path))
 
         logger.info("Downloaded %d file(s) to %s", len(downloaded_files), output_path)
         return downloaded_files
 
-    def _download_single(self, url: str, output_path: Path) -> str | None:
-        """Download a single video with optimized speed settings."""
-        logger.info("Downloading: %s", url)
-
-        # Build yt-dlp command
-        cmd = ["yt-dlp"]
-
-        # Set format based on quality and audio_only
+    def _build_download_cmd(self, output_path: Path) -> list[str]:
+        """Build the yt-dlp command line (without URLs) for this download."""
         if self.audio_only:
-            cmd.extend(["-f", "bestaudio/best"])
-            cmd.extend(["-x", "--audio-format", "mp3"])
+            format_args = _AUDIO_ONLY_CMD
         else:
-            format_str = QUALITY_FORMATS.get(self.quality, "best")
-            cmd.extend(["-f", format_str])
-            cmd.extend(["--merge-output-format", "mp4"])
-
-        # Output template
-        output_template = str(output_path / "%(title)s.%(ext)s")
-        cmd.extend(["-o", output_template])
-
-        # Basic options
-        cmd.extend([
-            "--no-playlist",        # Don't download playlists
-            "--progress",
-            # Note: removed --restrict-filenames to preserve Unicode in filenames
-        ])
-
-        # Speed optimizations
-        # Use native downloader with high concurrent fragments (best for YouTube DASH)
-        # aria2c is slower for DASH streams that need merging
-        cmd.extend([
+            format_args = _QUALITY_CMD.get(self.quality, _QUALITY_CMD["best"])
+
+        cmd = _BASE_DL_CMD + format_args + [
             "-N", str(self.concurrent_fragments),  # Concurrent fragment downloads (best for DASH/HLS)
-        ])
+            "-o", str(output_path / "%(title)s.%(ext)s"),
+        ]
+
+        # Audio-only downloads are a single stream with no merge step, where
+        # aria2c's multi-connection ranged download is much faster
+        if ARIA2C_AVAILABLE and (self.audio_only or self.quality == "audio"):
+            cmd += _ARIA2C_CMD
+
+        return cmd
+
+    def _make_ydl_opts(self, output_path: Path) -> dict:
+        """Build YoutubeDL options equivalent to _build_download_cmd()."""
+        opts = {
+            "outtmpl": str(output_path / "%(title)s.%(ext)s"),
+            "noplaylist": True,
+            "concurrent_fragment_downloads": self.concurrent_fragments,
+            "buffersize": 64 * 1024,
+            "http_chunk_size": 10 * 1024 * 1024,
+            "nocheckcertificate": True,
+            "updatetime": False,
+            "quiet": True,
+            "no_warnings": True,
+            "noprogress": True,
+            "socket_timeout": 30,  # Give up on stalled connections
+        }
+        if self.audio_only:
+            opts["format"] = "bestaudio/best"
+            opts["postprocessors"] = [{"key": "FFmpegExtractAudio", "preferredcodec": "mp3"}]
+        else:
+            opts["format"] = QUALITY_FORMATS.get(self.quality, QUALITY_FORMATS["best"])
+            opts["merge_output_format"] = "mp4"
 
-        # Additional speed optimizations
-        cmd.extend([
-            "--buffer-size", "64K",     # Larger buffer for better throughput
-            "--http-chunk-size", "10M", # Larger chunks reduce overhead
-            "--no-check-certificates",  # Skip cert verification (faster)
-            "--no-mtime",               # Don't set mtime (faster)
-        ])
+        if ARIA2C_AVAILABLE and (self.audio_only or self.quality == "audio"):
+            opts["external_downloader"] = {"default": "aria2c"}
+            opts["external_downloader_args"] = {"aria2c": ARIA2C_ARGS.split()}
 
-        # Add URL at the end
-        cmd.append(url)
+        return opts
 
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=600,  # 10 minute timeout
-            )
+    def _download_in_process(self, urls: list[str], output_path: Path) -> list[str] | None:
+        """Download videos with yt-dlp's Python API.
 
-            if result.returncode == 0:
-                # Try to find the downloaded file
-                # yt-dlp prints the destination file
-                for line in result.stdout.split("\n"):
-                    if "Destination:" in line or "has already been downloaded" in line:
-                        # Extract filename from output
-                        match = re.search(r"Destination: (.+)$", line)
-                        if match:
-                            logger.info("Downloaded: %s", match.group(1))
-                            return match.group(1)
-
-                        match = re.search(r"\[download\] (.+) has already been downloaded", line)
-                        if match:
-                            logger.info("Already exists: %s", match.group(1))
-                            return match.group(1)
-
-                # If we can't find specific file, just report success
-                logger.info("Download completed")
-                return str(output_path)
-            else:
-                logger.error("Error: %s", result.stderr[:200])
-                return None
+        Videos are split into `parallel` batches; each batch runs on its own
+        thread with its own YoutubeDL instance, which is reused for every
+        video in the batch. Each video is aborted after DOWNLOAD_TIMEOUT, and
+        stalled connections after socket_timeout.
 
-        except subprocess.TimeoutExpired:
-            logger.error("Download timed out")
-            return None
-        except FileNotFoundError:
-            logger.error("yt-dlp not found. Install with: uv add yt-dlp")
-            return None
-        except Exception as e:
-            logger.error("Error: %s", e)
+        Args:
+            urls: Video URLs to download.
+            output_path: Directory to save videos.
+
+        Returns:
+            List of downloaded file paths, or None if yt-dlp is not importable.
+        """
+        try:
+            from yt_dlp import YoutubeDL
+        except ImportError:
             return None
 
-    @classmethod
-    def add_to_parser(cls, subparsers) -> None:
-        """Add this command to argparse subparsers."""
-        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
+        opts = self._make_ydl_opts(output_path)
+
+        def _download_batch(batch: list[str]) -> list[str]:
+            downloaded = []
+            deadline = 0.0
+
+            def _on_progress(d: dict) -> None:
+                # Raising from a progress hook aborts the current download
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Download timed out after {DOWNLOAD_TIMEOUT}s")
+                if d.get("status") == "finished":
+                    logger.debug("Finished stream: %s", d.get("filename"))
+
+            with YoutubeDL({**opts, "progress_hooks": [_on_progress]}) as ydl:
+                for url in batch:
+                    logger.info("Downloading: %s", url)
+                    deadline = time.monotonic() + DOWNLOAD_TIMEOUT
+                    try:
+                        info = ydl.extract_info(url, download=True)
+                    except Exception as e:
+                        logger.error("Download failed for %s: %s", url, str(e)[:200])
+                        continue
+                    # The progress hook only sees the pre-merge streams; the
+                    # final path (after merging/audio extraction) is here
+                    requested = (info or {}).get("requested_downloads") or []
+                    filepath = requested[-1].get("filepath") if requested else None
+                    if filepath:
+                        logger.info("Downloaded: %s", filepath)
+                        downloaded.append(filepath)
+            return downloaded
+
+        workers = min(max(1, self.parallel), len(urls))
+        if workers == 1:
+            return _download_batch(urls)
+
+        batches = [urls[i::workers] for i in range(workers)]
+        downloaded_files = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for files in executor.map(_download_batch, batches):
+                downloaded_files.extend(files)
+        return downloaded_files
 
-        for name, fld in cls.__dataclass_fields__.items():
-            if name.startswith("_"):
-                continue
+    async def _run_downloads(self, batches: list[list[str]], output_path: Path) -> list[str]:
+        """Run the download batches concurrently, at most `parallel` at a time.
 
-            help_text = cls._cli_help.get(name, "")
-            is_required = fld.default is dataclasses.MISSING
-            default = fld.default if not is_required else None
-            short = cls._cli_short.get(name)
+        Args:
+            batches: Lists of video URLs, one yt-dlp process per list.
+            output_path: Directory to save videos.
 
-            if is_required:
-                names = [name]
-            else:
-                names = [f"--{name}"]
-                if short:
-                    names.insert(0, f"-{short}")
+        Returns:
+            List of downloaded file paths.
+        """
+        sem = asyncio.Semaphore(max(1, self.parallel))
+        results = await asyncio.gather(
+            *(self._download_batch_async(batch, output_path, sem) for batch in batches)
+        )
+        return [path for files in results for path in files]
 
-            kwargs = {"help": help_text}
+    async def _download_batch_async(
+        self, urls: list[str], output_path: Path, sem: asyncio.Semaphore
+    ) -> list[str]:
+        """Download several videos with a single yt-dlp process.
+
+        yt-dlp prints each file's final path (after merging/moving) as it
+        finishes, so no output scraping is needed.
+
+        Args:
+            urls: Video URLs to download.
+            output_path: Directory to save videos.
+            sem: Semaphore bounding concurrent yt-dlp processes.
+
+        Returns:
+            List of downloaded file paths.
+        """
+        cmd = self._build_download_cmd(output_path)
+        # --print implies --quiet; --no-progress also keeps the progress bar
+        # off stdout, which must only carry the printed paths
+        cmd.extend(["--print", "after_move:filepath", "--no-simulate", "--no-progress", *urls])
 
-            if not is_required:
-                kwargs["default"] = default
+        async with sem:
+            logger.info("Downloading %d video(s) in one yt-dlp run", len(urls))
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                )
+            except FileNotFoundError:
+                logger.error("yt-dlp not found. Install with: uv add yt-dlp")
+                return []
 
-            if name in cls._cli_choices:
-                kwargs["choices"] = cls._cli_choices[name]
+            downloaded = []
+
+            async def _read_output() -> None:
+                # With --print and --no-progress, stdout only carries the
+                # printed paths, plus any errors/warnings merged in from stderr
+                async for raw in proc.stdout:
+                    line = raw.decode(errors="replace").strip()
+                    if not line:
+                        continue
+                    if line.startswith("ERROR:"):
+                        logger.error("%s", line[:200])
+                    elif line.startswith("WARNING:"):
+                        logger.debug("%s", line)
+                    else:
+                        logger.info("Downloaded: %s", line)
+                        downloaded.append(line)
+                await proc.wait()
 
-            if fld.type is bool or (hasattr(fld, 'type') and fld.type is bool):
-                if default is True:
-                    names = [f"--no-{name}"]
-                    kwargs["action"] = "store_false"
-                    kwargs["dest"] = name
-                    kwargs.pop("default", None)
-                else:
-                    kwargs["action"] = "store_true"
+            try:
+                await asyncio.wait_for(_read_output(), timeout=DOWNLOAD_TIMEOUT * len(urls))
+            except asyncio.TimeoutError:
+                logger.error("Download timed out")
+            finally:
+                # Also reached on cancellation: never leave yt-dlp running
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
 
-            if fld.type is int:
-                kwargs["type"] = int
+            return downloaded
 
+    @classmethod
+    def add_to_parser(cls, subparsers) -> None:
+        """Add this command to argparse subparsers."""
+        parser = subparsers.add_parser(cls._cli_name, help=cls._cli_description)
+        for names, kwargs in cls._argspec:
             parser.add_argument(*names, **kwargs)
 
     @classmethod
     def from_args(cls, args) -> "YouTubeDownload":
         """Create instance from parsed args."""
-        kwargs = {}
-        for name in cls.__dataclass_fields__:
-            if name.startswith("_"):
-                continue
-            if hasattr(args, name):
-                kwargs[name] = getattr(args, name)
-        return cls(**kwargs)
+        return cls(**{name: getattr(args, name) for name in cls._field_names if hasattr(args, name)})